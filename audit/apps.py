@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AuditConfig(AppConfig):
     name = 'audit'
+
+    def ready(self):
+        # Register signal handlers for denormalized audit totals
+        from audit import signals  # noqa: F401
@@ -1,47 +1,63 @@
 from django import forms
+from django.forms import modelformset_factory
 from audit.models import Client, Audit, Project
 
+# Cache key for the serialized create-form metadata; cleared by audit.signals when projects change
+AUDIT_CREATE_METADATA_CACHE_KEY = 'audit:create:meta'
+
+# Shared widgets; ModelForm copies them into each form class's fields at class creation
+_DATE_WIDGET = forms.DateInput(attrs={'type': 'date'})
+_ADDR_WIDGET = forms.Textarea(attrs={'rows': 3})
+
 
 class ClientForm(forms.ModelForm):
     class Meta:
         model = Client
-        fields = ['contact_name', 'contact_email', 'contact_phone', 'address']
+        fields = ('contact_name', 'contact_email', 'contact_phone', 'address')
         widgets = {
-            'address': forms.Textarea(attrs={'rows': 3}),
+            'address': _ADDR_WIDGET,
         }
 
 
 class AuditForm(forms.ModelForm):
     class Meta:
         model = Audit
-        fields = ['project', 'audit_date', 'audit_type', 'audit_number', 'performed_by', 'report_number']
+        fields = ('project', 'audit_date', 'audit_type', 'audit_number', 'performed_by', 'report_number')
         widgets = {
-            'audit_date': forms.DateInput(attrs={'type': 'date'}),
+            'audit_date': _DATE_WIDGET,
         }
 
 
 class AuditScoreForm(forms.ModelForm):
+    # Entered as percentages; Audit stores them as basis points behind same-named properties
+    overall_score_percentage = forms.DecimalField(max_digits=5, decimal_places=2, min_value=0, max_value=100)
+    standard_required = forms.DecimalField(max_digits=5, decimal_places=2, min_value=0, max_value=100, initial=75)
+
     class Meta:
         model = Audit
-        fields = ['overall_score_percentage', 'standard_required']
+        fields = ('overall_score_percentage', 'standard_required')
+
+    def clean(self):
+        cleaned_data = super().clean()
+        # construct_instance() only copies model fields, so set the properties here
+        for name in AuditScoreForm.Meta.fields:
+            if cleaned_data.get(name) is not None:
+                setattr(self.instance, name, cleaned_data[name])
+        return cleaned_data
 
 
 class AuditNoticesForm(forms.ModelForm):
     class Meta:
         model = Audit
-        fields = ['improvement_notices', 'contravention_notices', 'prohibition_notices']
+        fields = ('improvement_notices', 'contravention_notices', 'prohibition_notices')
 
 
-class AuditModelForm(forms.ModelForm):
+class AuditModelForm(AuditForm, AuditScoreForm):
     """Full audit form used server-side to validate combined data."""
 
-    class Meta:
-        model = Audit
-        fields = [
-            'project', 'audit_date', 'audit_type', 'audit_number', 'performed_by', 'report_number',
-            'overall_score_percentage', 'standard_required',
-            'improvement_notices', 'contravention_notices', 'prohibition_notices'
-        ]
-        widgets = {
-            'audit_date': forms.DateInput(attrs={'type': 'date'})
-        }
+    class Meta(AuditForm.Meta):
+        fields = AuditForm.Meta.fields + AuditScoreForm.Meta.fields + AuditNoticesForm.Meta.fields
+
+
+# Validates a batch of audits in one pass for the bulk create endpoint
+AuditFormSet = modelformset_factory(Audit, form=AuditModelForm, extra=0)
@@ -1,15 +1,78 @@
 # your_app/management/commands/load_sample_audit.py
+from datetime import date
+from types import MappingProxyType
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from audit.models import (
     Client, ConsultingFirm, PrincipalContractor, Project, Audit,
     LegalAppointment, RiskRating, ActionItem
 )
-from django.utils import timezone
+
+AUDIT_DATE = date(2025, 7, 17)
+
+# Sample legal appointments
+LEGAL_APPOINTMENTS = (
+    MappingProxyType({
+        'appointment_type': LegalAppointment.AppointmentType.CEO_16_1,
+        'appointed_person': 'PRECIOUS MORGAN',
+        'actual_score': 2
+    }),
+    MappingProxyType({
+        'appointment_type': LegalAppointment.AppointmentType.CEO_16_2,
+        'appointed_person': 'EUGENE NDLOVU',
+        'actual_score': 2
+    }),
+    MappingProxyType({
+        'appointment_type': LegalAppointment.AppointmentType.CONSTR_MGR_8_1,
+        'appointed_person': 'THULANI KHUMALO',
+        'actual_score': 2
+    }),
+    MappingProxyType({
+        'appointment_type': LegalAppointment.AppointmentType.CHS_OFFICER_8_5,
+        'appointed_person': 'CHOEU SERAME',
+        'actual_score': 2
+    }),
+    MappingProxyType({
+        'appointment_type': LegalAppointment.AppointmentType.ELEC_INSP,
+        'appointed_person': '',
+        'actual_score': 0,
+        'comments': 'NONE COMPLIANCE.'
+    }),
+)
+
+# Standard risk ratings (level, time frame)
+RISK_RATINGS = (
+    ('CRITICAL', 'Immediate'),
+    ('HIGH', 'Within 24 hours'),
+    ('MEDIUM', 'Within 3 days'),
+    ('LOW', 'Within 7 days'),
+)
+
+# Sample action items
+ACTION_ITEMS = (
+    MappingProxyType({
+        'description': 'To ensure that all management and supervision personnel are appointed in writing and their competency certificates are attached to those appointments and accepted by appointees',
+        'regulation_reference': 'CR 8(5)',
+        'assigned_to': 'Principal Contractor'
+    }),
+    MappingProxyType({
+        'description': 'Ensure that a breathalyser is readily available on site. Random alcohol testing and records kept on site. Drug and Alcohol policy to be communicated regularly',
+        'regulation_reference': 'GSR.2(a)',
+        'assigned_to': 'Principal Contractor'
+    }),
+    MappingProxyType({
+        'description': 'Ensure Traffic Accommodation Layout Plan is displayed clearly and updated regularly as project progress',
+        'regulation_reference': '',
+        'assigned_to': 'Principal Contractor'
+    }),
+)
 
 
 class Command(BaseCommand):
     help = 'Loads sample audit data from the Gabby Construction report'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write('Loading sample audit data...')
 
@@ -56,7 +119,7 @@ class Command(BaseCommand):
             report_number="CHS-LSC-2025/06",
             defaults={
                 'project': project,
-                'audit_date': timezone.datetime(2025, 7, 17).date(),
+                'audit_date': AUDIT_DATE,
                 'audit_type': 'OHS',
                 'audit_number': '001',
                 'performed_by': 'LETHU SAFETY CONSULTANTS (PTY) LTD',
@@ -73,88 +136,53 @@ class Command(BaseCommand):
             self.stdout.write(f'Created audit: {audit.report_number}')
 
         # Create sample legal appointments
-        legal_appointments = [
-            {
-                'appointment_type': 'CEO_16_1',
-                'appointed_person': 'PRECIOUS MORGAN',
-                'actual_score': 2
-            },
-            {
-                'appointment_type': 'CEO_16_2',
-                'appointed_person': 'EUGENE NDLOVU',
-                'actual_score': 2
-            },
-            {
-                'appointment_type': 'CONSTR_MGR_8_1',
-                'appointed_person': 'THULANI KHUMALO',
-                'actual_score': 2
-            },
-            {
-                'appointment_type': 'CHS_OFFICER_8_5',
-                'appointed_person': 'CHOEU SERAME',
-                'actual_score': 2
-            },
-            {
-                'appointment_type': 'ELECT_INSP',
-                'appointed_person': '',
-                'actual_score': 0,
-                'comments': 'NONE COMPLIANCE.'
-            }
-        ]
-
-        for appt_data in legal_appointments:
-            LegalAppointment.objects.get_or_create(
-                audit=audit,
-                appointment_type=appt_data['appointment_type'],
-                defaults={
-                    'required_score': 2,
-                    'actual_score': appt_data['actual_score'],
-                    'appointed_person': appt_data['appointed_person'],
-                    'comments': appt_data.get('comments', '')
-                }
-            )
-
-        # Create risk ratings
-        risk_ratings = [
-            ('CRITICAL', 'Immediate'),
-            ('HIGH', 'Within 24 hours'),
-            ('MEDIUM', 'Within 3 days'),
-            ('LOW', 'Within 7 days'),
-        ]
-
-        for level, time_frame in risk_ratings:
-            RiskRating.objects.get_or_create(
-                level=level,
-                defaults={'time_frame': time_frame}
-            )
+        # One SELECT for the types already loaded, one INSERT for the rest
+        existing_types = set(
+            LegalAppointment.objects.filter(audit=audit).values_list('appointment_type', flat=True)
+        )
+        LegalAppointment.objects.bulk_create(
+            [
+                LegalAppointment(
+                    audit=audit,
+                    appointment_type=appt_data['appointment_type'],
+                    required_score=2,
+                    actual_score=appt_data['actual_score'],
+                    appointed_person=appt_data['appointed_person'],
+                    comments=appt_data.get('comments', '')
+                )
+                for appt_data in LEGAL_APPOINTMENTS
+                if appt_data['appointment_type'] not in existing_types
+            ],
+            batch_size=500
+        )
+        # bulk_create skips the score signals
+        audit.refresh_score_totals()
+
+        # Create risk ratings, leaving existing levels untouched
+        existing_levels = set(RiskRating.objects.values_list('level', flat=True))
+        RiskRating.objects.bulk_create(
+            [
+                RiskRating(level=level, time_frame=time_frame)
+                for level, time_frame in RISK_RATINGS
+                if level not in existing_levels
+            ],
+            batch_size=500
+        )
 
         # Create action items
-        action_items = [
-            {
-                'description': 'To ensure that all management and supervision personnel are appointed in writing and their competency certificates are attached to those appointments and accepted by appointees',
-                'regulation_reference': 'CR 8(5)',
-                'assigned_to': 'Principal Contractor'
-            },
-            {
-                'description': 'Ensure that a breathalyser is readily available on site. Random alcohol testing and records kept on site. Drug and Alcohol policy to be communicated regularly',
-                'regulation_reference': 'GSR.2(a)',
-                'assigned_to': 'Principal Contractor'
-            },
-            {
-                'description': 'Ensure Traffic Accommodation Layout Plan is displayed clearly and updated regularly as project progress',
-                'regulation_reference': '',
-                'assigned_to': 'Principal Contractor'
-            }
+        # ActionItem has no unique constraint to lean on, so skip descriptions already on this audit
+        existing_descriptions = set(
+            ActionItem.objects.filter(audit=audit).values_list('description', flat=True)
+        )
+        new_items = [
+            ActionItem(audit=audit, **item_data)
+            for item_data in ACTION_ITEMS
+            if item_data['description'] not in existing_descriptions
         ]
-
-        for item_data in action_items:
-            ActionItem.objects.get_or_create(
-                audit=audit,
-                description=item_data['description'],
-                defaults={
-                    'regulation_reference': item_data['regulation_reference'],
-                    'assigned_to': item_data['assigned_to']
-                }
-            )
+        # bulk_create skips save(), which normally fills in the preview
+        for item in new_items:
+            item.set_description_preview()
+        ActionItem.objects.bulk_create(new_items, batch_size=500)
+        audit.refresh_open_action_items()
 
         self.stdout.write(self.style.SUCCESS('Successfully loaded sample audit data!'))
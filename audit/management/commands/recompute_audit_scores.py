@@ -0,0 +1,86 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Q
+from audit.models import Audit
+
+CHUNK_SIZE = 1000
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _percent(bp):
+    return f'{bp / 100:.2f}%'
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes overall audit scores from the stored rows. Prints the changes without '
+        'writing them unless --apply is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--apply', action='store_true', help='Write the recomputed values')
+        parser.add_argument('--audit', type=int, action='append', dest='audit_ids', metavar='PK',
+                            help='Only this audit (repeatable)')
+        parser.add_argument('--report-number', action='append', dest='report_numbers',
+                            help='Only audits with this report number (repeatable)')
+        parser.add_argument('--recount-open-items', action='store_true',
+                            help='Also recount the open action item counters')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def _selected(self, options):
+        audits = Audit.objects.all()
+        selection = Q()
+        if options['audit_ids']:
+            selection |= Q(pk__in=options['audit_ids'])
+        if options['report_numbers']:
+            selection |= Q(report_number__in=options['report_numbers'])
+        return audits.filter(selection)
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        apply, chunk_size = options['apply'], options['chunk_size']
+        selected = self._selected(options)
+        # Stream audits that have scored items; iterator() keeps them out of the queryset cache
+        audits = selected.filter(computed_score_max__gt=0).only(
+            'id', 'report_number', 'overall_score_bp', 'computed_score_sum', 'computed_score_max'
+        ).iterator(chunk_size=chunk_size)
+
+        updated = 0
+        for chunk in _chunked(audits, chunk_size):
+            changed = []
+            for audit in chunk:
+                score_bp = audit.computed_score_bp
+                if audit.overall_score_bp != score_bp:
+                    self.stdout.write(
+                        f'{audit.report_number} (#{audit.pk}): '
+                        f'{_percent(audit.overall_score_bp)} -> {_percent(score_bp)}'
+                    )
+                    audit.overall_score_bp = score_bp
+                    changed.append(audit)
+            if apply:
+                # One UPDATE ... CASE per chunk instead of a save() per audit
+                updated += Audit.objects.bulk_update(changed, ['overall_score_bp'], batch_size=chunk_size)
+            else:
+                updated += len(changed)
+
+        if options['recount_open_items']:
+            drifted = selected.annotate(
+                actual_open=Count('action_items', filter=Q(action_items__completed=False))
+            ).exclude(open_action_items=F('actual_open')).values_list('pk', 'report_number', 'open_action_items', 'actual_open')
+            for pk, report_number, stored, actual in drifted:
+                self.stdout.write(f'{report_number} (#{pk}): open action items {stored} -> {actual}')
+            if apply:
+                # The counter drifts if action items were bulk-modified; recount it in one UPDATE
+                selected.refresh_open_action_items()
+
+        if apply:
+            self.stdout.write(self.style.SUCCESS(f'Updated {updated} audit score(s).'))
+        else:
+            self.stdout.write(f'{updated} audit score(s) would change. Re-run with --apply to write them.')
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-14 03:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0003_remove_client_employee_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='audit',
+            name='audit_date',
+            field=models.DateField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='audit',
+            name='report_number',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='permit_number',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='actionitem',
+            index=models.Index(fields=['audit', 'completed'], name='audit_actio_audit_i_aad408_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='actionitem',
+            index=models.Index(fields=['audit', 'risk_rating'], name='audit_actio_audit_i_d9699f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='visualobservation',
+            index=models.Index(fields=['audit', '-date_recorded'], name='audit_visua_audit_i_91d3ba_idx'),
+        ),
+    ]
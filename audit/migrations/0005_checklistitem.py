@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-14 03:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0004_audit_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChecklistItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('OHS_DOC', 'OHS Documentation'), ('TRAINING', 'Training and Communication'), ('INSPECTION', 'Inspection Registers'), ('SECURITY', 'Public Safety and Security'), ('PROTECTION', 'Employee Protection and Welfare'), ('FIRE', 'Fire Prevention and Emergencies'), ('HEALTH', 'Occupational Health'), ('INCIDENT', 'Incident Management'), ('INTOXICATION', 'Intoxication Management'), ('TRAFFIC', 'Traffic Accommodation')], max_length=20)),
+                ('item_code', models.CharField(max_length=50)),
+                ('required_score', models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)),
+                ('actual_score', models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])),
+                ('comments', models.TextField(blank=True, null=True)),
+                ('audit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='checklist_items', to='audit.audit')),
+            ],
+            options={
+                'unique_together': {('audit', 'category', 'item_code')},
+            },
+        ),
+    ]
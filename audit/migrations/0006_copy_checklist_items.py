@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-14 03:57
+
+from django.db import migrations
+
+# (table, category, item code column) for each checklist model folded into ChecklistItem
+LEGACY_CHECKLIST_TABLES = [
+    ('audit_ohsdocumentation', 'OHS_DOC', 'document_type'),
+    ('audit_trainingcommunication', 'TRAINING', 'item_type'),
+    ('audit_inspectionregister', 'INSPECTION', 'register_type'),
+    ('audit_publicsafetysecurity', 'SECURITY', 'item_type'),
+    ('audit_employeeprotection', 'PROTECTION', 'item_type'),
+    ('audit_fireprevention', 'FIRE', 'item_type'),
+    ('audit_occupationalhealth', 'HEALTH', 'item_type'),
+    ('audit_incidentmanagement', 'INCIDENT', 'item_type'),
+    ('audit_intoxicationmanagement', 'INTOXICATION', 'item_type'),
+    ('audit_trafficaccommodation', 'TRAFFIC', 'item_type'),
+]
+
+COPY_FORWARD = (
+    'INSERT INTO audit_checklistitem (audit_id, category, item_code, required_score, actual_score, comments) '
+    + ' UNION ALL '.join(
+        f"SELECT audit_id, '{category}', {column}, required_score, actual_score, comments FROM {table}"
+        for table, category, column in LEGACY_CHECKLIST_TABLES
+    )
+)
+
+COPY_BACKWARD = [
+    f"INSERT INTO {table} (audit_id, {column}, required_score, actual_score, comments) "
+    f"SELECT audit_id, item_code, required_score, actual_score, comments FROM audit_checklistitem "
+    f"WHERE category = '{category}'"
+    for table, category, column in LEGACY_CHECKLIST_TABLES
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0005_checklistitem'),
+    ]
+
+    operations = [
+        migrations.RunSQL(COPY_FORWARD, reverse_sql=COPY_BACKWARD),
+    ]
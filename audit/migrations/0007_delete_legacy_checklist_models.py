@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-10-14 03:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0006_copy_checklist_items'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='EmployeeProtection',
+        ),
+        migrations.DeleteModel(
+            name='FirePrevention',
+        ),
+        migrations.DeleteModel(
+            name='IncidentManagement',
+        ),
+        migrations.DeleteModel(
+            name='InspectionRegister',
+        ),
+        migrations.DeleteModel(
+            name='IntoxicationManagement',
+        ),
+        migrations.DeleteModel(
+            name='OccupationalHealth',
+        ),
+        migrations.DeleteModel(
+            name='OHSDocumentation',
+        ),
+        migrations.DeleteModel(
+            name='PublicSafetySecurity',
+        ),
+        migrations.DeleteModel(
+            name='TrafficAccommodation',
+        ),
+        migrations.DeleteModel(
+            name='TrainingCommunication',
+        ),
+    ]
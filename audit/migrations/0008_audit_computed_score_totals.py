@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-14 03:58
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_score_totals(apps, schema_editor):
+    Audit = apps.get_model('audit', 'Audit')
+    LegalAppointment = apps.get_model('audit', 'LegalAppointment')
+    ChecklistItem = apps.get_model('audit', 'ChecklistItem')
+
+    def total(model, column):
+        per_audit = model.objects.filter(audit=OuterRef('pk')).values('audit').annotate(total=Sum(column))
+        return Coalesce(Subquery(per_audit.values('total')), 0)
+
+    Audit.objects.update(
+        computed_score_sum=total(LegalAppointment, 'actual_score') + total(ChecklistItem, 'actual_score'),
+        computed_score_max=total(LegalAppointment, 'required_score') + total(ChecklistItem, 'required_score'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0007_delete_legacy_checklist_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audit',
+            name='computed_score_max',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='audit',
+            name='computed_score_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_score_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,194 @@
+# Generated by Django 6.0 on 2026-10-14 04:02
+
+from django.db import migrations, models
+
+# Codes in declaration order; the stored integer is the 1-based position (matches the choice enums)
+APPOINTMENT_CODES = [
+    'CEO_16_1', 'CEO_16_2', 'CONSTR_MGR_8_1', 'HCA', 'CONSTR_SUP_8_7', 'ELEC_INSP',
+    'CHS_OFFICER_8_5', 'FIRE_INSP_29H', 'ENV_OFFICER', 'EMERGENCY_COORD', 'HS_REP_17_1',
+    'EXCAVATION_SUP_13_1', 'RISK_ASSESSOR_9_1', 'PPE_INSP', 'FIRST_AIDER', 'HAND_TOOLS_INSP',
+    'STACKING_STORAGE', 'HS_COMMITTEE', 'HYGIENE_INSP', 'INCIDENT_INVEST', 'PORTABLE_ELEC_INSP',
+    'HOUSEKEEPING', 'VEHICLE_INSP', 'TRAFFIC_SAFETY', 'HS_CHAIRPERSON', 'VEHICLE_OPERATOR',
+]
+
+# Legacy strings written by older versions of the sample loader
+APPOINTMENT_ALIASES = {'ELECT_INSP': 'ELEC_INSP'}
+
+CHECKLIST_CODES = {
+    'OHS_DOC': [
+        'SHE_FILE', 'CLIENT_SPECS', 'RISK_ASSESSMENT', 'CONSTRUCTION_NOTICE', 'COIDA',
+        'INCIDENT_REGISTERS', 'WCL_FORMS', 'ACT_DISPLAY', 'CONTRACTOR_APPOINTMENT',
+        'MANDATORY_AGREEMENTS', 'POLICIES',
+    ],
+    'TRAINING': [
+        'INDUCTION_MANUAL', 'SAFETY_TALKS', 'DAILY_RISK_ASSESS', 'TRAFFIC_MEETINGS',
+    ],
+    'INSPECTION': [
+        'HS_REP_CHECKLIST', 'FIRST_AID_BOX', 'FIRE_EQUIPMENT', 'FACILITIES_HYGIENE',
+        'STACKING_STORAGE', 'HAND_TOOL', 'MOBILE_PLANT', 'PPE_REGISTER', 'INCIDENT_REGISTER',
+        'EXCAVATION', 'HOUSEKEEPING', 'VEHICLE_PRE_START', 'SIGNAGE', 'HYGIENE',
+    ],
+    'SECURITY': [
+        'ACCESS_CONTROL', 'GUARDHOUSE', 'SECURITY_PERSONNEL', 'PSIRA_REGISTRATION',
+        'SECURITY_RISK_ASSESS', 'FIRE_EXTINGUISHER', 'SECURITY_LETTER', 'SECURITY_MEDICAL',
+        'SECURITY_AGREEMENT', 'SECURITY_APPOINTMENT', 'PSIRA_REG', 'SECURITY_PPE',
+    ],
+    'PROTECTION': [
+        'PPE_ISSUED', 'AWARENESS', 'PROCEDURES',
+    ],
+    'FIRE': [
+        'EQUIPMENT_AVAILABLE', 'FIRE_FIGHTER_APPOINT', 'AWARENESS', 'COMPETENCIES',
+        'EVACUATION_PLAN', 'EVACUATION_DRILL', 'EMERGENCY_CONTACTS',
+    ],
+    'HEALTH': [
+        'ENTRY_MEDICAL_EXAM', 'MEDICAL_COPIES', 'ID_COPIES',
+    ],
+    'INCIDENT': [
+        'PROCEDURE', 'ANNEXURE', 'WCL_FORMS', 'DISCIPLINARY_PROC', 'NEAR_MISS',
+        'FIRST_AID_RECORDS',
+    ],
+    'INTOXICATION': [
+        'RANDOM_TESTING', 'DISCIPLINARY_PROC', 'ALCOHOL_DRUGS_POLICY', 'BREATHALYSER',
+    ],
+    'TRAFFIC': [
+        'FLAG_PEOPLE_TRAINED', 'SIGNS_UPDATED', 'UPDATE_REGISTER', 'ROAD_CLEAN',
+        'DEVIATION_DAMPED', 'DEVIATION_BLADED', 'CHILDREN_PROTECTION', 'VEHICLES_CONDITION',
+        'SAFETY_FEATURES', 'OPENINGS_BARRICADED', 'FLAG_POSITIONS', 'SIGNS_PLACEMENT',
+        'SIGNS_REGISTER',
+    ],
+}
+
+
+def codes_to_integers(apps, schema_editor):
+    LegalAppointment = apps.get_model('audit', 'LegalAppointment')
+    ChecklistItem = apps.get_model('audit', 'ChecklistItem')
+    categories = list(CHECKLIST_CODES)
+
+    appointments = list(LegalAppointment.objects.all())
+    for appointment in appointments:
+        code = APPOINTMENT_ALIASES.get(appointment.appointment_type, appointment.appointment_type)
+        appointment.appointment_type_int = APPOINTMENT_CODES.index(code) + 1
+    LegalAppointment.objects.bulk_update(appointments, ['appointment_type_int'], batch_size=1000)
+
+    items = list(ChecklistItem.objects.all())
+    for item in items:
+        item.category_int = categories.index(item.category) + 1
+        item.item_code_int = CHECKLIST_CODES[item.category].index(item.item_code) + 1
+    ChecklistItem.objects.bulk_update(items, ['category_int', 'item_code_int'], batch_size=1000)
+
+
+def integers_to_codes(apps, schema_editor):
+    LegalAppointment = apps.get_model('audit', 'LegalAppointment')
+    ChecklistItem = apps.get_model('audit', 'ChecklistItem')
+    categories = list(CHECKLIST_CODES)
+
+    appointments = list(LegalAppointment.objects.all())
+    for appointment in appointments:
+        appointment.appointment_type = APPOINTMENT_CODES[appointment.appointment_type_int - 1]
+    LegalAppointment.objects.bulk_update(appointments, ['appointment_type'], batch_size=1000)
+
+    items = list(ChecklistItem.objects.all())
+    for item in items:
+        item.category = categories[item.category_int - 1]
+        item.item_code = CHECKLIST_CODES[item.category][item.item_code_int - 1]
+    ChecklistItem.objects.bulk_update(items, ['category', 'item_code'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0008_audit_computed_score_totals'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='legalappointment',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='checklistitem',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='legalappointment',
+            name='appointment_type_int',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='checklistitem',
+            name='category_int',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='checklistitem',
+            name='item_code_int',
+            field=models.SmallIntegerField(null=True),
+        ),
+        # Nullable so the string columns can be re-added empty when migrating backwards
+        migrations.AlterField(
+            model_name='legalappointment',
+            name='appointment_type',
+            field=models.CharField(max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='category',
+            field=models.CharField(max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='item_code',
+            field=models.CharField(max_length=50, null=True),
+        ),
+        migrations.RunPython(codes_to_integers, integers_to_codes),
+        migrations.RemoveField(
+            model_name='legalappointment',
+            name='appointment_type',
+        ),
+        migrations.RemoveField(
+            model_name='checklistitem',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='checklistitem',
+            name='item_code',
+        ),
+        migrations.RenameField(
+            model_name='legalappointment',
+            old_name='appointment_type_int',
+            new_name='appointment_type',
+        ),
+        migrations.RenameField(
+            model_name='checklistitem',
+            old_name='category_int',
+            new_name='category',
+        ),
+        migrations.RenameField(
+            model_name='checklistitem',
+            old_name='item_code_int',
+            new_name='item_code',
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='category',
+            field=models.SmallIntegerField(choices=[(1, 'OHS Documentation'), (2, 'Training and Communication'), (3, 'Inspection Registers'), (4, 'Public Safety and Security'), (5, 'Employee Protection and Welfare'), (6, 'Fire Prevention and Emergencies'), (7, 'Occupational Health'), (8, 'Incident Management'), (9, 'Intoxication Management'), (10, 'Traffic Accommodation')]),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='item_code',
+            field=models.SmallIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='legalappointment',
+            name='appointment_type',
+            field=models.SmallIntegerField(choices=[(1, 'Chief Executive Officer Sec 16.1'), (2, 'Assistant CEO Sec 16.2'), (3, 'Construction Manager CR 8.1'), (4, 'HCA (Reg 2020)'), (5, 'Construction Supervisor CR 8.7'), (6, 'Electrical Equipment Inspector Controller'), (7, 'Construction Health and Safety Officer CR 8.5'), (8, 'Fire Equipment Inspector CR 29(h)'), (9, 'Environmental Officer'), (10, 'Emergency Coordinator'), (11, 'Health and Safety Representative Sec 17.1'), (12, 'Excavation Supervisor CR 13(1)'), (13, 'Risk Assessor CR 9.(1)'), (14, 'PPE Inspector'), (15, 'First Aider'), (16, 'Hand Tools Inspector Sec 8.2i'), (17, 'Stacking and Storage Supervisor CR 28(a)'), (18, 'Health and Safety Committee Member'), (19, 'Hygiene and Facility Inspector'), (20, 'Incident Investigator CR 29(h)'), (21, 'Portable Elec. Tools Inspector EMR 10'), (22, 'Housekeeping CR 27'), (23, 'CR 23 Construction Vehicle and Mobile Plant Inspector'), (24, 'Traffic Safety Officer'), (25, 'Chairperson Health and Safety Committee Sec 19'), (26, 'CR 23 Construction vehicle and Mobile Plant operator')]),
+        ),
+        migrations.AlterUniqueTogether(
+            name='legalappointment',
+            unique_together={('audit', 'appointment_type')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='checklistitem',
+            unique_together={('audit', 'category', 'item_code')},
+        ),
+    ]
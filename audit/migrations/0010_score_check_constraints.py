@@ -0,0 +1,62 @@
+# Generated by Django 6.0 on 2026-10-14 04:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0009_integer_choice_codes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='audit',
+            name='overall_score_percentage',
+            field=models.DecimalField(decimal_places=2, max_digits=5),
+        ),
+        migrations.AlterField(
+            model_name='audit',
+            name='standard_required',
+            field=models.DecimalField(decimal_places=2, default=75.0, max_digits=5),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='actual_score',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='required_score',
+            field=models.IntegerField(default=2),
+        ),
+        migrations.AlterField(
+            model_name='legalappointment',
+            name='required_score',
+            field=models.IntegerField(default=2),
+        ),
+        migrations.AddConstraint(
+            model_name='audit',
+            constraint=models.CheckConstraint(condition=models.Q(('overall_score_percentage__gte', 0), ('overall_score_percentage__lte', 100)), name='audit_score_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='audit',
+            constraint=models.CheckConstraint(condition=models.Q(('standard_required__gte', 0), ('standard_required__lte', 100)), name='audit_standard_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='checklistitem',
+            constraint=models.CheckConstraint(condition=models.Q(('required_score__in', (0, 1, 2))), name='checklistitem_required_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='checklistitem',
+            constraint=models.CheckConstraint(condition=models.Q(('actual_score__in', (0, 1, 2))), name='checklistitem_actual_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='legalappointment',
+            constraint=models.CheckConstraint(condition=models.Q(('required_score__in', (0, 1, 2))), name='legalappointment_required_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='legalappointment',
+            constraint=models.CheckConstraint(condition=models.Q(('actual_score__in', (0, 1, 2))), name='legalappointment_actual_score'),
+        ),
+    ]
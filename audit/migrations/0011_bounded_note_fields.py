@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-14 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0010_score_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='actionitem',
+            name='comments',
+            field=models.CharField(blank=True, max_length=1000, null=True),
+        ),
+        migrations.AlterField(
+            model_name='actionitem',
+            name='description',
+            field=models.CharField(max_length=1000),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='comments',
+            field=models.CharField(blank=True, max_length=1000, null=True),
+        ),
+        migrations.AlterField(
+            model_name='legalappointment',
+            name='comments',
+            field=models.CharField(blank=True, max_length=1000, null=True),
+        ),
+        migrations.AlterField(
+            model_name='visualobservation',
+            name='description',
+            field=models.CharField(max_length=1000),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-14 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0011_bounded_note_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='audit',
+            name='audit_date',
+            field=models.DateField(),
+        ),
+        migrations.AddIndex(
+            model_name='audit',
+            index=models.Index(fields=['-audit_date', 'report_number'], name='audit_audit_audit_d_4c34be_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-14 04:08
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_open_action_items(apps, schema_editor):
+    Audit = apps.get_model('audit', 'Audit')
+    ActionItem = apps.get_model('audit', 'ActionItem')
+
+    per_audit = ActionItem.objects.filter(audit=OuterRef('pk')).values('audit').annotate(
+        total=Count('pk', filter=Q(completed=False))
+    )
+    Audit.objects.update(open_action_items=Coalesce(Subquery(per_audit.values('total')), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0012_audit_list_order_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audit',
+            name='open_action_items',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_open_action_items, migrations.RunPython.noop),
+    ]
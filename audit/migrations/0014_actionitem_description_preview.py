@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-14 04:10
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+from django.db.models.functions import Concat, Left, Length
+from django.db.models.lookups import GreaterThan
+
+PREVIEW_LENGTH = 60
+
+
+def backfill_description_preview(apps, schema_editor):
+    ActionItem = apps.get_model('audit', 'ActionItem')
+    ActionItem.objects.update(
+        description_preview=Case(
+            When(
+                GreaterThan(Length('description'), PREVIEW_LENGTH),
+                then=Concat(Left('description', PREVIEW_LENGTH - 3), Value('...')),
+            ),
+            default='description',
+            output_field=models.CharField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0013_audit_open_action_items'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='actionitem',
+            name='description_preview',
+            field=models.CharField(default='', editable=False, max_length=60),
+        ),
+        migrations.RunPython(backfill_description_preview, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 6.0 on 2026-10-14 04:11
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, IntegerField
+from django.db.models.functions import Cast, Round
+
+
+def percentages_to_bp(apps, schema_editor):
+    Audit = apps.get_model('audit', 'Audit')
+    Audit.objects.update(
+        overall_score_bp=Cast(Round(F('overall_score_percentage') * 100), IntegerField()),
+        standard_required_bp=Cast(Round(F('standard_required') * 100), IntegerField()),
+    )
+
+
+def bp_to_percentages(apps, schema_editor):
+    # Done in Python: dividing the integer columns in SQL truncates on SQLite (8457 -> 84)
+    Audit = apps.get_model('audit', 'Audit')
+    audits = list(Audit.objects.only('id', 'overall_score_bp', 'standard_required_bp').iterator(chunk_size=1000))
+    for audit in audits:
+        audit.overall_score_percentage = Decimal(audit.overall_score_bp) / 100
+        audit.standard_required = Decimal(audit.standard_required_bp) / 100
+    Audit.objects.bulk_update(audits, ['overall_score_percentage', 'standard_required'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0014_actionitem_description_preview'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='audit',
+            name='audit_score_range',
+        ),
+        migrations.RemoveConstraint(
+            model_name='audit',
+            name='audit_standard_range',
+        ),
+        migrations.AddField(
+            model_name='audit',
+            name='overall_score_bp',
+            field=models.SmallIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='audit',
+            name='standard_required_bp',
+            field=models.SmallIntegerField(default=7500),
+        ),
+        # Nullable so the decimal columns can be re-added when migrating backwards
+        migrations.AlterField(
+            model_name='audit',
+            name='overall_score_percentage',
+            field=models.DecimalField(decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.AlterField(
+            model_name='audit',
+            name='standard_required',
+            field=models.DecimalField(decimal_places=2, default=75.0, max_digits=5, null=True),
+        ),
+        migrations.RunPython(percentages_to_bp, bp_to_percentages),
+        migrations.RemoveField(
+            model_name='audit',
+            name='overall_score_percentage',
+        ),
+        migrations.RemoveField(
+            model_name='audit',
+            name='standard_required',
+        ),
+        migrations.AddConstraint(
+            model_name='audit',
+            constraint=models.CheckConstraint(condition=models.Q(('overall_score_bp__gte', 0), ('overall_score_bp__lte', 10000)), name='audit_score_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='audit',
+            constraint=models.CheckConstraint(condition=models.Q(('standard_required_bp__gte', 0), ('standard_required_bp__lte', 10000)), name='audit_standard_range'),
+        ),
+    ]
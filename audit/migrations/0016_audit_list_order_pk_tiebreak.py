@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-14 04:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0015_audit_score_basis_points'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='audit',
+            name='audit_audit_audit_d_4c34be_idx',
+        ),
+        migrations.AddIndex(
+            model_name='audit',
+            index=models.Index(fields=['-audit_date', '-id'], name='audit_audit_audit_d_7d75cf_idx'),
+        ),
+    ]
@@ -1,8 +1,22 @@
-from django.db import models
-from django.core.validators import MinValueValidator, MaxValueValidator
+from decimal import Decimal
+from functools import cached_property
+from itertools import groupby
+from operator import attrgetter
+
+from django.db import connections, models
+from django.db.models import Count, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.core.exceptions import ValidationError
 
 # Create your models here.
 
+# Allowed checklist/appointment scores (0 = non-compliant, 2 = fully compliant)
+SCORE_VALUES = (0, 1, 2)
+
+# Bound for free-text notes; sample data tops out well under 200 chars.
+# Kept unindexed as nothing searches these columns.
+NOTE_MAX_LENGTH = 1000
+
 # ========== COMPANY & PROJECT MODELS ==========
 class Client(models.Model):
     """Client organization commissioning the work"""
@@ -37,7 +51,7 @@ class PrincipalContractor(models.Model):
 class Project(models.Model):
     """Construction project being audited"""
     title = models.CharField(max_length=500)
-    permit_number = models.CharField(max_length=100)
+    permit_number = models.CharField(max_length=100, db_index=True)
     location = models.CharField(max_length=500)
     client = models.ForeignKey(Client, on_delete=models.CASCADE)
     consulting_engineer = models.ForeignKey(ConsultingFirm, on_delete=models.CASCADE)
@@ -48,353 +62,464 @@ class Project(models.Model):
 
 
 # ========== AUDIT & COMPLIANCE MODELS ==========
+class AuditQuerySet(models.QuerySet):
+    # Columns rendered by the report list; everything else stays deferred
+    LIST_FIELDS = (
+        'id', 'audit_date', 'audit_number', 'audit_type', 'report_number', 'overall_score_bp',
+        'project__title', 'project__permit_number', 'project__client__name', 'project__client__contact_email',
+    )
+
+    def for_list(self):
+        """Narrow rows for list pages: only LIST_FIELDS, with project and client joined in."""
+        return self.select_related('project__client').only(*self.LIST_FIELDS)
+
+    def newest_first(self):
+        """List order for report pages; served by the (-audit_date, -id) index.
+
+        The pk tiebreak keeps pagination stable across audits on the same date.
+        """
+        return self.order_by('-audit_date', '-pk')
+
+    def refresh_open_action_items(self):
+        """Recount open_action_items for every audit in the queryset with one UPDATE.
+
+        Run after bulk ActionItem changes that skip the counter signals.
+        """
+        open_items = ActionItem.objects.filter(audit=OuterRef('pk'), completed=False).values('audit').annotate(
+            total=Count('pk')
+        )
+        return self.update(open_action_items=Coalesce(Subquery(open_items.values('total')), 0))
+
+    def with_project(self):
+        """Join the project and its client/consultant/contractor in the same SELECT."""
+        return self.select_related('project__client', 'project__consulting_engineer', 'project__principal_contractor')
+
+    # Child collections returned by detail_json(), by related name
+    DETAIL_COLLECTIONS = ('legal_appointments', 'checklist_items', 'action_items', 'visual_observations')
+
+    def detail_json(self, pk):
+        """An audit and its child rows as plain dicts, or None if it doesn't exist.
+
+        PostgreSQL builds the nested document in one query with json_agg; other
+        backends fall back to one values() query per collection. Read-only: no
+        model instances are created either way.
+        """
+        connection = connections[self.db]
+        if connection.vendor != 'postgresql':
+            opts = self.model._meta
+            related = {name: opts.get_field(name).related_model for name in (*self.DETAIL_COLLECTIONS, 'personnel')}
+            audit = self.filter(pk=pk).values().first()
+            if audit is not None:
+                for name in self.DETAIL_COLLECTIONS:
+                    audit[name] = list(related[name].objects.using(self.db).filter(audit_id=pk).values())
+                audit['personnel'] = related['personnel'].objects.using(self.db).filter(audit_id=pk).values().first()
+            return audit
+
+        sql = self.detail_json_sql(connection.ops.quote_name)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [pk])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def detail_json_sql(self, quote):
+        """The PostgreSQL query behind detail_json(); takes the audit pk as its one parameter."""
+        opts = self.model._meta
+        table = {name: quote(opts.get_field(name).related_model._meta.db_table)
+                 for name in (*self.DETAIL_COLLECTIONS, 'personnel')}
+        collections = ', '.join(
+            f"(SELECT COALESCE(json_agg(c), '[]'::json) FROM {table[name]} c "
+            f"WHERE c.audit_id = a.id) AS {quote(name)}"
+            for name in self.DETAIL_COLLECTIONS
+        )
+        return (
+            f"SELECT row_to_json(d) FROM (SELECT a.*, {collections}, "
+            f"(SELECT row_to_json(p) FROM {table['personnel']} p "
+            f"WHERE p.audit_id = a.id) AS personnel "
+            f"FROM {quote(opts.db_table)} a WHERE a.id = %s) d"
+        )
+
+    def with_full_detail(self):
+        """Everything an audit page renders: project joins plus one batched query per child collection."""
+        return self.with_project().select_related('personnel').prefetch_related(
+            'legal_appointments',
+            'checklist_items',
+            'visual_observations',
+            Prefetch('action_items', queryset=ActionItem.objects.select_related('risk_rating')),
+        )
+
+
 class Audit(models.Model):
     """Main audit record"""
-    AUDIT_TYPES = [
-        ('OHS', 'Occupational Health & Safety Audit'),
-        ('ENV', 'Environmental Audit'),
-        ('QUAL', 'Quality Audit'),
-    ]
+    class AuditType(models.TextChoices):
+        OHS = 'OHS', 'Occupational Health & Safety Audit'
+        ENV = 'ENV', 'Environmental Audit'
+        QUAL = 'QUAL', 'Quality Audit'
 
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     audit_date = models.DateField()
-    audit_type = models.CharField(max_length=10, choices=AUDIT_TYPES, default='OHS')
+    audit_type = models.CharField(max_length=10, choices=AuditType.choices, default=AuditType.OHS)
     audit_number = models.CharField(max_length=50)  # e.g., "001"
     performed_by = models.CharField(max_length=200)  # e.g., "LETHU SAFETY CONSULTANTS (PTY) LTD"
-    report_number = models.CharField(max_length=100)  # e.g., "CHS-LSC-2025/06"
-    overall_score_percentage = models.DecimalField(max_digits=5, decimal_places=2,
-                                                   validators=[MinValueValidator(0), MaxValueValidator(100)])
-    standard_required = models.DecimalField(max_digits=5, decimal_places=2, default=75.00,
-                                            validators=[MinValueValidator(0), MaxValueValidator(100)])
+    report_number = models.CharField(max_length=100, db_index=True)  # e.g., "CHS-LSC-2025/06"
+    # Percentages stored as basis points (8400 = 84.00%); 0-10000 enforced by the check constraints in Meta.
+    # Read and write them through the overall_score_percentage/standard_required properties below.
+    overall_score_bp = models.SmallIntegerField()
+    standard_required_bp = models.SmallIntegerField(default=7500)
 
     # Notices issued during audit
     improvement_notices = models.IntegerField(default=0)
     contravention_notices = models.IntegerField(default=0)
     prohibition_notices = models.IntegerField(default=0)
 
-    def __str__(self):
-        return f"Audit {self.audit_number} - {self.audit_date} - {self.project}"
-
-
-class LegalAppointment(models.Model):
-    """Legal appointments as per regulations"""
-    APPOINTMENT_TYPES = [
-        ('CEO_16_1', 'Chief Executive Officer Sec 16.1'),
-        ('CEO_16_2', 'Assistant CEO Sec 16.2'),
-        ('CONSTR_MGR_8_1', 'Construction Manager CR 8.1'),
-        ('HCA', 'HCA (Reg 2020)'),
-        ('CONSTR_SUP_8_7', 'Construction Supervisor CR 8.7'),
-        ('ELEC_INSP', 'Electrical Equipment Inspector Controller'),
-        ('CHS_OFFICER_8_5', 'Construction Health and Safety Officer CR 8.5'),
-        ('FIRE_INSP_29H', 'Fire Equipment Inspector CR 29(h)'),
-        ('ENV_OFFICER', 'Environmental Officer'),
-        ('EMERGENCY_COORD', 'Emergency Coordinator'),
-        ('HS_REP_17_1', 'Health and Safety Representative Sec 17.1'),
-        ('EXCAVATION_SUP_13_1', 'Excavation Supervisor CR 13(1)'),
-        ('RISK_ASSESSOR_9_1', 'Risk Assessor CR 9.(1)'),
-        ('PPE_INSP', 'PPE Inspector'),
-        ('FIRST_AIDER', 'First Aider'),
-        ('HAND_TOOLS_INSP', 'Hand Tools Inspector Sec 8.2i'),
-        ('STACKING_STORAGE', 'Stacking and Storage Supervisor CR 28(a)'),
-        ('HS_COMMITTEE', 'Health and Safety Committee Member'),
-        ('HYGIENE_INSP', 'Hygiene and Facility Inspector'),
-        ('INCIDENT_INVEST', 'Incident Investigator CR 29(h)'),
-        ('PORTABLE_ELEC_INSP', 'Portable Elec. Tools Inspector EMR 10'),
-        ('HOUSEKEEPING', 'Housekeeping CR 27'),
-        ('VEHICLE_INSP', 'CR 23 Construction Vehicle and Mobile Plant Inspector'),
-        ('TRAFFIC_SAFETY', 'Traffic Safety Officer'),
-        ('HS_CHAIRPERSON', 'Chairperson Health and Safety Committee Sec 19'),
-        ('VEHICLE_OPERATOR', 'CR 23 Construction vehicle and Mobile Plant operator'),
-    ]
-
-    COMPLIANCE_STATUS = [
-        (0, 'Non-Compliant'),
-        (1, 'Partial Compliance'),
-        (2, 'Fully Compliant'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='legal_appointments')
-    appointment_type = models.CharField(max_length=50, choices=APPOINTMENT_TYPES)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=COMPLIANCE_STATUS)
-    appointed_person = models.CharField(max_length=200, blank=True, null=True)
-    comments = models.TextField(blank=True, null=True)
-
-    class Meta:
-        unique_together = ['audit', 'appointment_type']
-
-    def __str__(self):
-        return f"{self.get_appointment_type_display()} - Score: {self.actual_score}/2"
-
-
-class OHSDocumentation(models.Model):
-    """OHS Documentation compliance"""
-    DOCUMENT_TYPES = [
-        ('SHE_FILE', 'SHE File on site'),
-        ('CLIENT_SPECS', 'Clients Safety Specifications CR 9'),
-        ('RISK_ASSESSMENT', 'Baseline Risk Assessment'),
-        ('CONSTRUCTION_NOTICE', 'Notification of Construction'),
-        ('COIDA', 'COIDA Letter of good standing'),
-        ('INCIDENT_REGISTERS', 'Incident Registers'),
-        ('WCL_FORMS', 'WCL1 – WCL6 Forms'),
-        ('ACT_DISPLAY', 'Copy of Act display on site'),
-        ('CONTRACTOR_APPOINTMENT', 'Contractors Appointment CR.5(1)(K)'),
-        ('MANDATORY_AGREEMENTS', 'Signed Mandatory Agreements'),
-        ('POLICIES', 'Polices to be updated'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='ohs_documents')
-    document_type = models.CharField(max_length=50, choices=DOCUMENT_TYPES)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
-
-    class Meta:
-        unique_together = ['audit', 'document_type']
-
-    def __str__(self):
-        return f"{self.get_document_type_display()} - {self.actual_score}/2"
-
-
-class TrainingCommunication(models.Model):
-    """Training and Communication compliance"""
-    TRAINING_TYPES = [
-        ('INDUCTION_MANUAL', 'Health and Safety Induction Manual'),
-        ('SAFETY_TALKS', 'Health and Safety Talks'),
-        ('DAILY_RISK_ASSESS', 'Daily Task Risk Assessments'),
-        ('TRAFFIC_MEETINGS', 'Daily Traffic Accommodation Meetings'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='training_items')
-    item_type = models.CharField(max_length=50, choices=TRAINING_TYPES)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
-
-    class Meta:
-        unique_together = ['audit', 'item_type']
-
-    def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
-
-class InspectionRegister(models.Model):
-    """Inspection registers compliance"""
-    REGISTER_TYPES = [
-        ('HS_REP_CHECKLIST', 'Health and Safety Rep Inspection Checklist'),
-        ('FIRST_AID_BOX', 'First Aid Box Inspection Registers'),
-        ('FIRE_EQUIPMENT', 'Fire Extinguishing Equipment Register'),
-        ('FACILITIES_HYGIENE', 'Facilities/hygiene Inspection Register'),
-        ('STACKING_STORAGE', 'Stacking & Storage Register'),
-        ('HAND_TOOL', 'Hand Tool Register'),
-        ('MOBILE_PLANT', 'Mobile Plant Checklists'),
-        ('PPE_REGISTER', 'PPE Registers'),
-        ('INCIDENT_REGISTER', 'Incident Registers'),
-        ('EXCAVATION', 'Excavation Inspection Register'),
-        ('HOUSEKEEPING', 'Housekeeping Checklist'),
-        ('VEHICLE_PRE_START', 'Construction Vehicle Pre-Start Checklist'),
-        ('SIGNAGE', 'Signage Checklist'),
-        ('HYGIENE', 'Hygiene Checklist'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='inspection_registers')
-    register_type = models.CharField(max_length=50, choices=REGISTER_TYPES)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+    # Running totals over legal appointments and checklist items, kept current by audit.signals
+    computed_score_sum = models.IntegerField(default=0, editable=False)
+    computed_score_max = models.IntegerField(default=0, editable=False)
+    # Maintained from ActionItem saves/deletes in audit.signals
+    open_action_items = models.PositiveIntegerField(default=0, editable=False)
 
-    class Meta:
-        unique_together = ['audit', 'register_type']
+    objects = AuditQuerySet.as_manager()
 
-    def __str__(self):
-        return f"{self.get_register_type_display()} - {self.actual_score}/2"
-
-
-class PublicSafetySecurity(models.Model):
-    """Public Safety and Security compliance"""
-    SECURITY_ITEMS = [
-        ('ACCESS_CONTROL', 'Access Control Register'),
-        ('GUARDHOUSE', 'Guardhouse On site'),
-        ('SECURITY_PERSONNEL', 'Security Personnel on site'),
-        ('PSIRA_REGISTRATION', 'PSIRA Registered security appointment'),
-        ('SECURITY_RISK_ASSESS', 'Security Risk Assessment'),
-        ('FIRE_EXTINGUISHER', 'Fire Extinguisher'),
-        ('SECURITY_LETTER', 'Letter of Good Standing (Security)'),
-        ('SECURITY_MEDICAL', 'Medical certificate (Security)'),
-        ('SECURITY_AGREEMENT', 'Mandatory Agreement (Security)'),
-        ('SECURITY_APPOINTMENT', 'Appointment Letter (Security)'),
-        ('PSIRA_REG', 'PSIRA Registration'),
-        ('SECURITY_PPE', 'PPE (Security)'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='security_items')
-    item_type = models.CharField(max_length=50, choices=SECURITY_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+    _audit_type_labels = dict(AuditType.choices)
 
     class Meta:
-        unique_together = ['audit', 'item_type']
+        # No default ordering: related and prefetch queries stay unsorted, list pages use newest_first()
+        indexes = [
+            # Also covers plain audit_date filters as its leading column
+            models.Index(fields=['-audit_date', '-id']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(overall_score_bp__gte=0) & Q(overall_score_bp__lte=10000),
+                name='audit_score_range',
+            ),
+            models.CheckConstraint(
+                condition=Q(standard_required_bp__gte=0) & Q(standard_required_bp__lte=10000),
+                name='audit_standard_range',
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
+        return f"Audit {self.audit_number} - {self.audit_date} - {self.project}"
 
+    @cached_property
+    def audit_type_label(self):
+        return self._audit_type_labels.get(self.audit_type, self.audit_type)
+
+    @staticmethod
+    def _to_bp(percentage):
+        return int((Decimal(str(percentage)) * 100).to_integral_value())
+
+    @property
+    def overall_score_percentage(self):
+        return self.overall_score_bp / 100
+
+    @overall_score_percentage.setter
+    def overall_score_percentage(self, value):
+        self.overall_score_bp = self._to_bp(value)
+
+    @property
+    def standard_required(self):
+        return self.standard_required_bp / 100
+
+    @standard_required.setter
+    def standard_required(self, value):
+        self.standard_required_bp = self._to_bp(value)
+
+    # Written only by audit.signals and the refresh_*() methods, never by a plain save()
+    SIGNAL_MAINTAINED_FIELDS = frozenset({'computed_score_sum', 'computed_score_max', 'open_action_items'})
+
+    def save(self, *args, **kwargs):
+        # A full save of a loaded audit would write back the counters as they were when it was
+        # read, wiping out signal updates made since; leave them out of the UPDATE.
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.SIGNAL_MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def checklist_sections(self):
+        """Checklist items grouped by category, fetched with a single query (or from with_full_detail())."""
+        items = sorted(self.checklist_items.all(), key=attrgetter('category'))
+        return {category: list(group) for category, group in groupby(items, key=attrgetter('category'))}
+
+    @property
+    def computed_score_bp(self):
+        """Overall score implied by the stored totals, in basis points (None without scored items)."""
+        if not self.computed_score_max:
+            return None
+        return round(self.computed_score_sum * 10000 / self.computed_score_max)
+
+    def refresh_score_totals(self):
+        """Recompute the denormalized score totals, e.g. after bulk inserts that bypass signals."""
+        totals = [
+            related.aggregate(actual=Sum('actual_score', default=0), required=Sum('required_score', default=0))
+            for related in (self.legal_appointments, self.checklist_items)
+        ]
+        self.computed_score_sum = sum(t['actual'] for t in totals)
+        self.computed_score_max = sum(t['required'] for t in totals)
+        self.save(update_fields=['computed_score_sum', 'computed_score_max'])
+
+    def refresh_open_action_items(self):
+        """Recount open action items from the table.
+
+        The counter is only maintained by ActionItem save/delete signals, so this must
+        run after any bulk mutation that bypasses them (bulk_create, bulk_update,
+        queryset.update()/delete()). AuditQuerySet.refresh_open_action_items() does
+        the same for many audits in one UPDATE.
+        """
+        self.open_action_items = self.action_items.filter(completed=False).count()
+        self.save(update_fields=['open_action_items'])
 
-class EmployeeProtection(models.Model):
-    """Employee Protection and Welfare compliance"""
-    PROTECTION_ITEMS = [
-        ('PPE_ISSUED', 'PPE Issued and being worn (free of charge)'),
-        ('AWARENESS', 'Employees are aware of their OHS duties'),
-        ('PROCEDURES', 'Procedure for addressing OHS concerns'),
-    ]
 
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='protection_items')
-    item_type = models.CharField(max_length=50, choices=PROTECTION_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+class LegalAppointment(models.Model):
+    """Legal appointments as per regulations"""
+    class AppointmentType(models.IntegerChoices):
+        CEO_16_1 = 1, 'Chief Executive Officer Sec 16.1'
+        CEO_16_2 = 2, 'Assistant CEO Sec 16.2'
+        CONSTR_MGR_8_1 = 3, 'Construction Manager CR 8.1'
+        HCA = 4, 'HCA (Reg 2020)'
+        CONSTR_SUP_8_7 = 5, 'Construction Supervisor CR 8.7'
+        ELEC_INSP = 6, 'Electrical Equipment Inspector Controller'
+        CHS_OFFICER_8_5 = 7, 'Construction Health and Safety Officer CR 8.5'
+        FIRE_INSP_29H = 8, 'Fire Equipment Inspector CR 29(h)'
+        ENV_OFFICER = 9, 'Environmental Officer'
+        EMERGENCY_COORD = 10, 'Emergency Coordinator'
+        HS_REP_17_1 = 11, 'Health and Safety Representative Sec 17.1'
+        EXCAVATION_SUP_13_1 = 12, 'Excavation Supervisor CR 13(1)'
+        RISK_ASSESSOR_9_1 = 13, 'Risk Assessor CR 9.(1)'
+        PPE_INSP = 14, 'PPE Inspector'
+        FIRST_AIDER = 15, 'First Aider'
+        HAND_TOOLS_INSP = 16, 'Hand Tools Inspector Sec 8.2i'
+        STACKING_STORAGE = 17, 'Stacking and Storage Supervisor CR 28(a)'
+        HS_COMMITTEE = 18, 'Health and Safety Committee Member'
+        HYGIENE_INSP = 19, 'Hygiene and Facility Inspector'
+        INCIDENT_INVEST = 20, 'Incident Investigator CR 29(h)'
+        PORTABLE_ELEC_INSP = 21, 'Portable Elec. Tools Inspector EMR 10'
+        HOUSEKEEPING = 22, 'Housekeeping CR 27'
+        VEHICLE_INSP = 23, 'CR 23 Construction Vehicle and Mobile Plant Inspector'
+        TRAFFIC_SAFETY = 24, 'Traffic Safety Officer'
+        HS_CHAIRPERSON = 25, 'Chairperson Health and Safety Committee Sec 19'
+        VEHICLE_OPERATOR = 26, 'CR 23 Construction vehicle and Mobile Plant operator'
+
+    class ComplianceStatus(models.IntegerChoices):
+        NON_COMPLIANT = 0, 'Non-Compliant'
+        PARTIAL = 1, 'Partial Compliance'
+        FULLY_COMPLIANT = 2, 'Fully Compliant'
 
-    class Meta:
-        unique_together = ['audit', 'item_type']
+    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='legal_appointments')
+    appointment_type = models.SmallIntegerField(choices=AppointmentType.choices)
+    required_score = models.IntegerField(default=2)
+    actual_score = models.IntegerField(choices=ComplianceStatus.choices)
+    appointed_person = models.CharField(max_length=200, blank=True, null=True)
+    comments = models.CharField(max_length=NOTE_MAX_LENGTH, blank=True, null=True)
 
-    def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
-
-class FirePrevention(models.Model):
-    """Fire Prevention and Emergencies compliance"""
-    FIRE_ITEMS = [
-        ('EQUIPMENT_AVAILABLE', 'Suitable fire extinguishing equipment available'),
-        ('FIRE_FIGHTER_APPOINT', 'Fire fighter Appointment'),
-        ('AWARENESS', 'Employees aware of emergency procedures'),
-        ('COMPETENCIES', 'Fire Fighter Competencies'),
-        ('EVACUATION_PLAN', 'Fire emergency evacuation layout plan visible'),
-        ('EVACUATION_DRILL', 'Fire emergency evacuation drill conducted'),
-        ('EMERGENCY_CONTACTS', 'Emergency Contact numbers in place'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='fire_prevention_items')
-    item_type = models.CharField(max_length=50, choices=FIRE_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+    _label_cache = dict(AppointmentType.choices)
 
     class Meta:
-        unique_together = ['audit', 'item_type']
-
-    def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
-
-class OccupationalHealth(models.Model):
-    """Occupational Health compliance"""
-    HEALTH_ITEMS = [
-        ('ENTRY_MEDICAL_EXAM', 'Entry Medical Examinations'),
-        ('MEDICAL_COPIES', 'Copies of medical examinations on file'),
-        ('ID_COPIES', 'ID copies on site'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='occupational_health_items')
-    item_type = models.CharField(max_length=50, choices=HEALTH_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+        unique_together = ['audit', 'appointment_type']
+        constraints = [
+            models.CheckConstraint(condition=Q(required_score__in=SCORE_VALUES), name='legalappointment_required_score'),
+            models.CheckConstraint(condition=Q(actual_score__in=SCORE_VALUES), name='legalappointment_actual_score'),
+        ]
 
-    class Meta:
-        unique_together = ['audit', 'item_type']
+    @cached_property
+    def display_label(self):
+        return self._label_cache.get(self.appointment_type, self.appointment_type)
 
     def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
-
-class IncidentManagement(models.Model):
-    """Incident Management compliance"""
-    INCIDENT_ITEMS = [
-        ('PROCEDURE', 'Incident Management Procedure'),
-        ('ANNEXURE', 'Annexure.1'),
-        ('WCL_FORMS', 'WCL1 - WCL6 forms available'),
-        ('DISCIPLINARY_PROC', 'Disciplinary Procedure in place'),
-        ('NEAR_MISS', 'Near – miss records'),
-        ('FIRST_AID_RECORDS', 'First Aid Injury Records'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='incident_items')
-    item_type = models.CharField(max_length=50, choices=INCIDENT_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+        return f"{self.display_label} - Score: {self.actual_score}/2"
+
+
+# ========== CHECKLIST ITEMS ==========
+class ChecklistCategory(models.IntegerChoices):
+    OHS_DOC = 1, 'OHS Documentation'
+    TRAINING = 2, 'Training and Communication'
+    INSPECTION = 3, 'Inspection Registers'
+    SECURITY = 4, 'Public Safety and Security'
+    PROTECTION = 5, 'Employee Protection and Welfare'
+    FIRE = 6, 'Fire Prevention and Emergencies'
+    HEALTH = 7, 'Occupational Health'
+    INCIDENT = 8, 'Incident Management'
+    INTOXICATION = 9, 'Intoxication Management'
+    TRAFFIC = 10, 'Traffic Accommodation'
+
+
+class DocumentType(models.IntegerChoices):
+    SHE_FILE = 1, 'SHE File on site'
+    CLIENT_SPECS = 2, 'Clients Safety Specifications CR 9'
+    RISK_ASSESSMENT = 3, 'Baseline Risk Assessment'
+    CONSTRUCTION_NOTICE = 4, 'Notification of Construction'
+    COIDA = 5, 'COIDA Letter of good standing'
+    INCIDENT_REGISTERS = 6, 'Incident Registers'
+    WCL_FORMS = 7, 'WCL1 – WCL6 Forms'
+    ACT_DISPLAY = 8, 'Copy of Act display on site'
+    CONTRACTOR_APPOINTMENT = 9, 'Contractors Appointment CR.5(1)(K)'
+    MANDATORY_AGREEMENTS = 10, 'Signed Mandatory Agreements'
+    POLICIES = 11, 'Polices to be updated'
+
+
+class TrainingType(models.IntegerChoices):
+    INDUCTION_MANUAL = 1, 'Health and Safety Induction Manual'
+    SAFETY_TALKS = 2, 'Health and Safety Talks'
+    DAILY_RISK_ASSESS = 3, 'Daily Task Risk Assessments'
+    TRAFFIC_MEETINGS = 4, 'Daily Traffic Accommodation Meetings'
+
+
+class RegisterType(models.IntegerChoices):
+    HS_REP_CHECKLIST = 1, 'Health and Safety Rep Inspection Checklist'
+    FIRST_AID_BOX = 2, 'First Aid Box Inspection Registers'
+    FIRE_EQUIPMENT = 3, 'Fire Extinguishing Equipment Register'
+    FACILITIES_HYGIENE = 4, 'Facilities/hygiene Inspection Register'
+    STACKING_STORAGE = 5, 'Stacking & Storage Register'
+    HAND_TOOL = 6, 'Hand Tool Register'
+    MOBILE_PLANT = 7, 'Mobile Plant Checklists'
+    PPE_REGISTER = 8, 'PPE Registers'
+    INCIDENT_REGISTER = 9, 'Incident Registers'
+    EXCAVATION = 10, 'Excavation Inspection Register'
+    HOUSEKEEPING = 11, 'Housekeeping Checklist'
+    VEHICLE_PRE_START = 12, 'Construction Vehicle Pre-Start Checklist'
+    SIGNAGE = 13, 'Signage Checklist'
+    HYGIENE = 14, 'Hygiene Checklist'
+
+
+class SecurityItem(models.IntegerChoices):
+    ACCESS_CONTROL = 1, 'Access Control Register'
+    GUARDHOUSE = 2, 'Guardhouse On site'
+    SECURITY_PERSONNEL = 3, 'Security Personnel on site'
+    PSIRA_REGISTRATION = 4, 'PSIRA Registered security appointment'
+    SECURITY_RISK_ASSESS = 5, 'Security Risk Assessment'
+    FIRE_EXTINGUISHER = 6, 'Fire Extinguisher'
+    SECURITY_LETTER = 7, 'Letter of Good Standing (Security)'
+    SECURITY_MEDICAL = 8, 'Medical certificate (Security)'
+    SECURITY_AGREEMENT = 9, 'Mandatory Agreement (Security)'
+    SECURITY_APPOINTMENT = 10, 'Appointment Letter (Security)'
+    PSIRA_REG = 11, 'PSIRA Registration'
+    SECURITY_PPE = 12, 'PPE (Security)'
+
+
+class ProtectionItem(models.IntegerChoices):
+    PPE_ISSUED = 1, 'PPE Issued and being worn (free of charge)'
+    AWARENESS = 2, 'Employees are aware of their OHS duties'
+    PROCEDURES = 3, 'Procedure for addressing OHS concerns'
+
+
+class FireItem(models.IntegerChoices):
+    EQUIPMENT_AVAILABLE = 1, 'Suitable fire extinguishing equipment available'
+    FIRE_FIGHTER_APPOINT = 2, 'Fire fighter Appointment'
+    AWARENESS = 3, 'Employees aware of emergency procedures'
+    COMPETENCIES = 4, 'Fire Fighter Competencies'
+    EVACUATION_PLAN = 5, 'Fire emergency evacuation layout plan visible'
+    EVACUATION_DRILL = 6, 'Fire emergency evacuation drill conducted'
+    EMERGENCY_CONTACTS = 7, 'Emergency Contact numbers in place'
+
+
+class HealthItem(models.IntegerChoices):
+    ENTRY_MEDICAL_EXAM = 1, 'Entry Medical Examinations'
+    MEDICAL_COPIES = 2, 'Copies of medical examinations on file'
+    ID_COPIES = 3, 'ID copies on site'
+
+
+class IncidentItem(models.IntegerChoices):
+    PROCEDURE = 1, 'Incident Management Procedure'
+    ANNEXURE = 2, 'Annexure.1'
+    WCL_FORMS = 3, 'WCL1 - WCL6 forms available'
+    DISCIPLINARY_PROC = 4, 'Disciplinary Procedure in place'
+    NEAR_MISS = 5, 'Near – miss records'
+    FIRST_AID_RECORDS = 6, 'First Aid Injury Records'
+
+
+class IntoxicationItem(models.IntegerChoices):
+    RANDOM_TESTING = 1, 'Random Alcohol testing'
+    DISCIPLINARY_PROC = 2, 'Disciplinary Procedure in place'
+    ALCOHOL_DRUGS_POLICY = 3, 'Alcohol and Drugs Policy'
+    BREATHALYSER = 4, 'Breathalyser'
+
+
+class TrafficItem(models.IntegerChoices):
+    FLAG_PEOPLE_TRAINED = 1, 'Flag people trained for this job'
+    SIGNS_UPDATED = 2, 'Signs updated before start and end of shift'
+    UPDATE_REGISTER = 3, 'Register for update records'
+    ROAD_CLEAN = 4, 'Existing road is clean and free from danger'
+    DEVIATION_DAMPED = 5, 'Deviations damped with water to minimize dust'
+    DEVIATION_BLADED = 6, 'Deviation bladed if required'
+    CHILDREN_PROTECTION = 7, 'Children free from being injured'
+    VEHICLES_CONDITION = 8, 'Construction vehicles in good conditions'
+    SAFETY_FEATURES = 9, 'Safety features on construction vehicles'
+    OPENINGS_BARRICADED = 10, 'All openings are barricaded'
+    FLAG_POSITIONS = 11, 'Flag people always in required positions'
+    SIGNS_PLACEMENT = 12, 'Signs placed according to specifications'
+    SIGNS_REGISTER = 13, 'Signs register updated daily'
+
+
+# Item codes accepted for each checklist category
+CHECKLIST_ITEMS = {
+    ChecklistCategory.OHS_DOC: DocumentType,
+    ChecklistCategory.TRAINING: TrainingType,
+    ChecklistCategory.INSPECTION: RegisterType,
+    ChecklistCategory.SECURITY: SecurityItem,
+    ChecklistCategory.PROTECTION: ProtectionItem,
+    ChecklistCategory.FIRE: FireItem,
+    ChecklistCategory.HEALTH: HealthItem,
+    ChecklistCategory.INCIDENT: IncidentItem,
+    ChecklistCategory.INTOXICATION: IntoxicationItem,
+    ChecklistCategory.TRAFFIC: TrafficItem,
+}
+
+
+class ChecklistItem(models.Model):
+    """Scored checklist item for any OHS checklist section (documentation, training, registers, ...)"""
+    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='checklist_items')
+    category = models.SmallIntegerField(choices=ChecklistCategory.choices)
+    item_code = models.SmallIntegerField()  # one of CHECKLIST_ITEMS[category]
+    required_score = models.IntegerField(default=2)
+    actual_score = models.IntegerField()
+    comments = models.CharField(max_length=NOTE_MAX_LENGTH, blank=True, null=True)
+
+    # (category, item_code) -> label across every checklist section
+    _label_cache = {
+        (category, code): label
+        for category, item_type in CHECKLIST_ITEMS.items()
+        for code, label in item_type.choices
+    }
 
     class Meta:
-        unique_together = ['audit', 'item_type']
-
-    def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
+        # The unique index also serves (audit, category) lookups as its leading columns
+        unique_together = ['audit', 'category', 'item_code']
+        constraints = [
+            models.CheckConstraint(condition=Q(required_score__in=SCORE_VALUES), name='checklistitem_required_score'),
+            models.CheckConstraint(condition=Q(actual_score__in=SCORE_VALUES), name='checklistitem_actual_score'),
+        ]
 
-class IntoxicationManagement(models.Model):
-    """Intoxication Management compliance"""
-    INTOXICATION_ITEMS = [
-        ('RANDOM_TESTING', 'Random Alcohol testing'),
-        ('DISCIPLINARY_PROC', 'Disciplinary Procedure in place'),
-        ('ALCOHOL_DRUGS_POLICY', 'Alcohol and Drugs Policy'),
-        ('BREATHALYSER', 'Breathalyser'),
-    ]
+    def clean(self):
+        super().clean()
+        if self.category in CHECKLIST_ITEMS and self.item_code not in CHECKLIST_ITEMS[self.category].values:
+            raise ValidationError({'item_code': f"'{self.item_code}' is not a valid {self.get_category_display()} item."})
 
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='intoxication_items')
-    item_type = models.CharField(max_length=50, choices=INTOXICATION_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
+    def get_item_code_display(self):
+        return self._label_cache.get((self.category, self.item_code), self.item_code)
 
-    class Meta:
-        unique_together = ['audit', 'item_type']
+    @cached_property
+    def display_label(self):
+        return self.get_item_code_display()
 
     def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
-
-
-class TrafficAccommodation(models.Model):
-    """Traffic Accommodation compliance"""
-    TRAFFIC_ITEMS = [
-        ('FLAG_PEOPLE_TRAINED', 'Flag people trained for this job'),
-        ('SIGNS_UPDATED', 'Signs updated before start and end of shift'),
-        ('UPDATE_REGISTER', 'Register for update records'),
-        ('ROAD_CLEAN', 'Existing road is clean and free from danger'),
-        ('DEVIATION_DAMPED', 'Deviations damped with water to minimize dust'),
-        ('DEVIATION_BLADED', 'Deviation bladed if required'),
-        ('CHILDREN_PROTECTION', 'Children free from being injured'),
-        ('VEHICLES_CONDITION', 'Construction vehicles in good conditions'),
-        ('SAFETY_FEATURES', 'Safety features on construction vehicles'),
-        ('OPENINGS_BARRICADED', 'All openings are barricaded'),
-        ('FLAG_POSITIONS', 'Flag people always in required positions'),
-        ('SIGNS_PLACEMENT', 'Signs placed according to specifications'),
-        ('SIGNS_REGISTER', 'Signs register updated daily'),
-    ]
-
-    audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='traffic_items')
-    item_type = models.CharField(max_length=50, choices=TRAFFIC_ITEMS)
-    required_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)], default=2)
-    actual_score = models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])
-    comments = models.TextField(blank=True, null=True)
-
-    class Meta:
-        unique_together = ['audit', 'item_type']
-
-    def __str__(self):
-        return f"{self.get_item_type_display()} - {self.actual_score}/2"
+        return f"{self.display_label} - {self.actual_score}/2"
 
 
 # ========== ACTION ITEMS & FOLLOW-UP ==========
 class RiskRating(models.Model):
     """Standard risk rating timeframes"""
-    RISK_LEVELS = [
-        ('CRITICAL', 'Critical'),
-        ('HIGH', 'High'),
-        ('MEDIUM', 'Medium'),
-        ('LOW', 'Low'),
-    ]
-
-    level = models.CharField(max_length=20, choices=RISK_LEVELS, unique=True)
+    class RiskLevel(models.TextChoices):
+        CRITICAL = 'CRITICAL', 'Critical'
+        HIGH = 'HIGH', 'High'
+        MEDIUM = 'MEDIUM', 'Medium'
+        LOW = 'LOW', 'Low'
+
+    level = models.CharField(max_length=20, choices=RiskLevel.choices, unique=True)
     time_frame = models.CharField(max_length=100)
 
     def __str__(self):
@@ -403,18 +528,50 @@ class RiskRating(models.Model):
 
 class ActionItem(models.Model):
     """Corrective action items identified during audit"""
+    PREVIEW_LENGTH = 60
+
     audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='action_items')
-    description = models.TextField()
+    description = models.CharField(max_length=NOTE_MAX_LENGTH)
+    # Truncated copy of description for __str__ and list views that defer the full text
+    description_preview = models.CharField(max_length=PREVIEW_LENGTH, editable=False, default='')
     regulation_reference = models.CharField(max_length=100, blank=True, null=True)  # e.g., "CR 8(5)"
     assigned_to = models.CharField(max_length=200)  # e.g., "Principal Contractor"
     risk_rating = models.ForeignKey(RiskRating, on_delete=models.SET_NULL, null=True, blank=True)
     due_date = models.DateField(null=True, blank=True)
     completed = models.BooleanField(default=False)
     completion_date = models.DateField(null=True, blank=True)
-    comments = models.TextField(blank=True, null=True)
+    comments = models.CharField(max_length=NOTE_MAX_LENGTH, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['audit', 'completed']),
+            models.Index(fields=['audit', 'risk_rating']),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Stored (audit, open) state the counter signals diff against; None if not loaded
+        if 'audit_id' in field_names and 'completed' in field_names:
+            instance._loaded_open = (instance.audit_id, not instance.completed)
+        return instance
+
+    def set_description_preview(self):
+        """Refresh description_preview; bulk_create callers must call this themselves."""
+        description = self.description or ''
+        if len(description) > self.PREVIEW_LENGTH:
+            description = description[:self.PREVIEW_LENGTH - 3] + '...'
+        self.description_preview = description
+
+    def save(self, *args, **kwargs):
+        self.set_description_preview()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'description' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'description_preview'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"Action Item: {self.description[:50]}..."
+        return f"Action Item: {self.description_preview}"
 
 
 class SitePersonnel(models.Model):
@@ -432,10 +589,15 @@ class SitePersonnel(models.Model):
 class VisualObservation(models.Model):
     """Visual observations/photo reports"""
     audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name='visual_observations')
-    description = models.TextField()
+    description = models.CharField(max_length=NOTE_MAX_LENGTH)
     observation_type = models.CharField(max_length=100, blank=True, null=True)  # e.g., "Housekeeping", "Excavation"
     photo_reference = models.CharField(max_length=200, blank=True, null=True)  # File path or reference to photo
     date_recorded = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['audit', '-date_recorded']),
+        ]
+
     def __str__(self):
         return f"Observation: {self.description[:50]}..."
\ No newline at end of file
@@ -0,0 +1,34 @@
+import inspect
+from functools import cached_property
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.inspect import method_has_no_args
+
+# Cache key for the report list total; cleared by audit.signals when audits are added or removed
+AUDIT_COUNT_CACHE_KEY = 'audit:report-count'
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator whose total count is shared across requests through the cache.
+
+    Saves the COUNT(*) every page load would otherwise run. The count can lag
+    by up to ``count_timeout`` seconds unless ``cache_key`` is deleted on writes.
+    """
+
+    def __init__(self, object_list, per_page, *, cache_key, count_timeout=30, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.count_timeout = count_timeout
+
+    @cached_property
+    def count(self):
+        return cache.get_or_set(self.cache_key, self._count_rows, self.count_timeout)
+
+    def _count_rows(self):
+        """Total number of objects, run only on a cache miss."""
+        count = getattr(self.object_list, 'count', None)
+        # list.count() takes an argument; only call the queryset-style no-argument count()
+        if callable(count) and not inspect.isbuiltin(count) and method_has_no_args(count):
+            return count()
+        return len(self.object_list)
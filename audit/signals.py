@@ -0,0 +1,109 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from audit.forms import AUDIT_CREATE_METADATA_CACHE_KEY
+from audit.models import Audit, LegalAppointment, ChecklistItem, ActionItem, Project
+from audit.pagination import AUDIT_COUNT_CACHE_KEY
+
+# Legal appointment and checklist scores roll up into Audit.computed_score_sum / computed_score_max
+
+
+def _apply_score_delta(audit_id, actual, required):
+    """Shift an audit's score totals in place without reading the row."""
+    if actual or required:
+        Audit.objects.filter(pk=audit_id).update(
+            computed_score_sum=F('computed_score_sum') + actual,
+            computed_score_max=F('computed_score_max') + required,
+        )
+
+
+@receiver(pre_save, sender=LegalAppointment)
+@receiver(pre_save, sender=ChecklistItem)
+def capture_previous_score(sender, instance, **kwargs):
+    # Remember the stored row so post_save only applies the difference
+    previous = None
+    if instance.pk is not None and not instance._state.adding:
+        previous = sender.objects.filter(pk=instance.pk).values_list(
+            'audit_id', 'actual_score', 'required_score'
+        ).first()
+    instance._previous_score = previous
+
+
+@receiver(post_save, sender=LegalAppointment)
+@receiver(post_save, sender=ChecklistItem)
+def apply_score_change(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_score', None)
+    if previous is None:
+        _apply_score_delta(instance.audit_id, instance.actual_score, instance.required_score)
+        return
+    audit_id, actual, required = previous
+    if audit_id != instance.audit_id:
+        _apply_score_delta(audit_id, -actual, -required)
+        _apply_score_delta(instance.audit_id, instance.actual_score, instance.required_score)
+    else:
+        _apply_score_delta(audit_id, instance.actual_score - actual, instance.required_score - required)
+    instance._previous_score = None
+
+
+@receiver(post_delete, sender=LegalAppointment)
+@receiver(post_delete, sender=ChecklistItem)
+def remove_score(sender, instance, **kwargs):
+    _apply_score_delta(instance.audit_id, -instance.actual_score, -instance.required_score)
+
+
+# Open (not completed) action items are counted into Audit.open_action_items
+
+
+def _apply_open_delta(audit_id, delta):
+    # Clamped at 0: queryset.update()/bulk_update() skip these signals, so a drifted counter
+    # must not turn a valid delete into a positive-field CHECK failure
+    if delta:
+        Audit.objects.filter(pk=audit_id).update(open_action_items=Greatest(F('open_action_items') + delta, 0))
+
+
+@receiver(pre_save, sender=ActionItem)
+def capture_previous_open_state(sender, instance, **kwargs):
+    # from_db already recorded the stored state; only query when it wasn't loaded
+    if instance._state.adding or hasattr(instance, '_loaded_open'):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list('audit_id', 'completed').first()
+    if previous is not None:
+        instance._loaded_open = (previous[0], not previous[1])
+
+
+@receiver(post_save, sender=ActionItem)
+def apply_open_change(sender, instance, created, **kwargs):
+    current = (instance.audit_id, not instance.completed)
+    previous = None if created else getattr(instance, '_loaded_open', None)
+    if previous is None:
+        _apply_open_delta(instance.audit_id, int(current[1]))
+    elif previous[0] != current[0]:
+        _apply_open_delta(previous[0], -int(previous[1]))
+        _apply_open_delta(current[0], int(current[1]))
+    else:
+        _apply_open_delta(current[0], int(current[1]) - int(previous[1]))
+    instance._loaded_open = current
+
+
+@receiver(post_delete, sender=ActionItem)
+def remove_open_item(sender, instance, **kwargs):
+    audit_id, is_open = getattr(instance, '_loaded_open', (instance.audit_id, not instance.completed))
+    _apply_open_delta(audit_id, -int(is_open))
+
+
+@receiver(post_save, sender=Audit)
+@receiver(post_delete, sender=Audit)
+def clear_audit_count(sender, created=True, **kwargs):
+    # Only inserts and deletes change the report list total
+    if created:
+        cache.delete(AUDIT_COUNT_CACHE_KEY)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def clear_create_metadata(sender, **kwargs):
+    # Project is the only ModelChoiceField on AuditForm; its labels are baked into the metadata
+    cache.delete(AUDIT_CREATE_METADATA_CACHE_KEY)
@@ -0,0 +1,30 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+
+def _send_share_email(subject, body, from_email, to_email):
+    try:
+        send_mail(subject, body, from_email, [to_email], fail_silently=False)
+    except Exception:
+        # Nobody is waiting on the response any more, so the failure can only be logged
+        logger.exception('Failed to send report share email to %s', to_email)
+
+
+def send_share_email(subject, body, from_email, to_email):
+    """Send a report share email without holding up the request.
+
+    There is no task queue deployed, so the SMTP round-trip runs on a daemon
+    thread. Under settings.TESTING it runs inline (and raises) so tests can
+    inspect mail.outbox.
+    """
+    if getattr(settings, 'TESTING', False):
+        send_mail(subject, body, from_email, [to_email], fail_silently=False)
+        return
+    threading.Thread(
+        target=_send_share_email, args=(subject, body, from_email, to_email), daemon=True
+    ).start()
@@ -1,33 +1,46 @@
 from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from audit.models import Client as ClientModel, ConsultingFirm, PrincipalContractor, Project, Audit
+from audit.models import Client as ClientModel, ConsultingFirm, PrincipalContractor, Project, Audit, ChecklistItem, ChecklistCategory, FireItem, DocumentType, ActionItem, RiskRating
 import json
 from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from io import StringIO
+from audit.pagination import CachedCountPaginator, AUDIT_COUNT_CACHE_KEY
+from audit import tasks
+from unittest import mock
 
 User = get_user_model()
 
 
-@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+@override_settings(
+    # Only the share test inspects mail.outbox and switches back to locmem
+    EMAIL_BACKEND='django.core.mail.backends.dummy.EmailBackend',
+    # Fast hashing for the test user; the default PBKDF2 dominates login cost
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class AuditAppTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class; each test runs in a transaction rolled back to this state
         # Create a user
-        self.username = 'testuser'
-        self.password = 'password'
-        self.user = User.objects.create_user(username=self.username, password=self.password)
+        cls.username = 'testuser'
+        cls.password = 'password'
+        cls.user = User.objects.create_user(username=cls.username, password=cls.password)
 
         # Create related models
-        self.client_org = ClientModel.objects.create(name='ACME')
-        self.client_org.contact_email = 'client@example.com'
-        self.client_org.contact_name = 'Client Contact'
-        self.client_org.save()
-        self.cf = ConsultingFirm.objects.create(name='ConsultCo')
-        self.pc = PrincipalContractor.objects.create(name='PrimeBuild')
-        self.project = Project.objects.create(title='Test Project', permit_number='P-1', location='Site', client=self.client_org, consulting_engineer=self.cf, principal_contractor=self.pc)
+        cls.client_org = ClientModel.objects.create(name='ACME')
+        cls.client_org.contact_email = 'client@example.com'
+        cls.client_org.contact_name = 'Client Contact'
+        cls.client_org.save()
+        cls.cf = ConsultingFirm.objects.create(name='ConsultCo')
+        cls.pc = PrincipalContractor.objects.create(name='PrimeBuild')
+        cls.project = Project.objects.create(title='Test Project', permit_number='P-1', location='Site', client=cls.client_org, consulting_engineer=cls.cf, principal_contractor=cls.pc)
 
         # Create a sample audit
-        self.audit = Audit.objects.create(
-            project=self.project,
+        cls.audit = Audit.objects.create(
+            project=cls.project,
             audit_date='2026-01-01',
             audit_type='OHS',
             audit_number='001',
@@ -40,7 +53,10 @@ class AuditAppTests(TestCase):
             prohibition_notices=0,
         )
 
+    def setUp(self):
+        # Per-test client and cache: sessions, cached counts and form metadata must not leak between tests
         self.client = Client()
+        cache.clear()
 
     def test_index_shows_login_when_anonymous_and_lorem_when_authenticated(self):
         # anonymous
@@ -49,7 +65,7 @@ class AuditAppTests(TestCase):
         self.assertContains(resp, 'Please log in to continue')
 
         # authenticate
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         resp2 = self.client.get(reverse('audit:index'))
         self.assertEqual(resp2.status_code, 200)
         self.assertContains(resp2, 'Lorem ipsum')
@@ -57,7 +73,7 @@ class AuditAppTests(TestCase):
     def test_login_form_and_ajax(self):
         # non-AJAX form login should redirect to dashboard
         resp = self.client.post(reverse('audit:login-ajax'), data={'username': self.username, 'password': self.password})
-        self.assertIn(resp.status_code, (302, 301))
+        self.assertRedirects(resp, reverse('audit:dashboard'), fetch_redirect_response=False)
         # AJAX JSON login
         resp2 = self.client.post(reverse('audit:login-ajax'), data=json.dumps({'username': self.username, 'password': self.password}), content_type='application/json')
         self.assertEqual(resp2.status_code, 200)
@@ -67,19 +83,19 @@ class AuditAppTests(TestCase):
 
     def test_logout_non_ajax_and_ajax(self):
         # login first
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         # non-AJAX logout -> redirect
         resp = self.client.post(reverse('audit:logout-ajax'), data={})
-        self.assertIn(resp.status_code, (302, 301))
+        self.assertRedirects(resp, '/', fetch_redirect_response=False)
         # AJAX logout: login again then call with JSON
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         resp2 = self.client.post(reverse('audit:logout-ajax'), data=json.dumps({}), content_type='application/json')
         self.assertEqual(resp2.status_code, 200)
         self.assertTrue(resp2.json().get('success'))
 
     def test_reports_create_metadata_and_post(self):
         # login
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         # GET metadata
         resp = self.client.get(reverse('audit:report-create-ajax'))
         self.assertEqual(resp.status_code, 200)
@@ -88,6 +104,11 @@ class AuditAppTests(TestCase):
         self.assertIn('score_fields', data)
         self.assertIn('notice_fields', data)
 
+        # cached metadata is rebuilt once a project is added
+        Project.objects.create(title='Second Project', permit_number='P-2', location='Site', client=self.client_org, consulting_engineer=self.cf, principal_contractor=self.pc)
+        project_field = next(f for f in self.client.get(reverse('audit:report-create-ajax')).json()['fields'] if f['name'] == 'project')
+        self.assertIn('Second Project - P-2', [c['label'] for c in project_field['choices']])
+
         # POST create
         payload = {
             'project': str(self.project.pk),
@@ -110,8 +131,41 @@ class AuditAppTests(TestCase):
         self.assertIsNotNone(new_id)
         self.assertTrue(Audit.objects.filter(pk=new_id).exists())
 
+    def test_reports_bulk_create(self):
+        self.client.force_login(self.user)
+        base = {
+            'project': str(self.project.pk),
+            'audit_date': '2026-02-01',
+            'audit_type': 'OHS',
+            'performed_by': 'Bulk',
+            'overall_score_percentage': '70.00',
+            'standard_required': '75.00',
+            'improvement_notices': 0,
+            'contravention_notices': 0,
+            'prohibition_notices': 0,
+        }
+        payload = [dict(base, audit_number='010', report_number='R-010'), dict(base, audit_number='011', report_number='R-011')]
+        resp = self.client.post(reverse('audit:report-bulk-create-ajax'), data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.json().get('success'))
+        self.assertEqual(Audit.objects.filter(report_number__in=['R-010', 'R-011']).count(), 2)
+
+        # one invalid row rejects the whole batch
+        bad = [dict(base, audit_number='012', report_number='R-012'), dict(base, audit_number='013', report_number='R-013', project='')]
+        resp2 = self.client.post(reverse('audit:report-bulk-create-ajax'), data=json.dumps(bad), content_type='application/json')
+        self.assertEqual(resp2.status_code, 400)
+        self.assertIn('project', resp2.json()['errors'][1])
+        self.assertFalse(Audit.objects.filter(report_number='R-012').exists())
+
+        # out-of-range scores are rejected by the form, not the database
+        out_of_range = [dict(base, audit_number='014', report_number='R-014', overall_score_percentage='150.00')]
+        resp3 = self.client.post(reverse('audit:report-bulk-create-ajax'), data=json.dumps(out_of_range), content_type='application/json')
+        self.assertEqual(resp3.status_code, 400)
+        self.assertIn('overall_score_percentage', resp3.json()['errors'][0])
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
     def test_share_report_success_and_invalid(self):
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         # valid share
         resp = self.client.post(reverse('audit:report-share-ajax', args=[self.audit.pk]), data=json.dumps({'to_email': 'receiver@example.com', 'message': 'Please see report'}), content_type='application/json')
         self.assertEqual(resp.status_code, 200)
@@ -128,8 +182,35 @@ class AuditAppTests(TestCase):
         self.assertFalse(d2.get('success'))
         self.assertIn('to_email', d2.get('errors', {}))
 
+    @override_settings(TESTING=False)
+    def test_share_email_sends_on_daemon_thread(self):
+        with mock.patch('audit.tasks.threading.Thread') as thread:
+            tasks.send_share_email('Report', 'Body', 'from@example.com', 'to@example.com')
+        thread.assert_called_once_with(
+            target=tasks._send_share_email,
+            args=('Report', 'Body', 'from@example.com', 'to@example.com'),
+            daemon=True,
+        )
+        thread.return_value.start.assert_called_once_with()
+
+    def test_share_email_failure_is_logged_not_raised(self):
+        with mock.patch('audit.tasks.send_mail', side_effect=OSError('SMTP down')), \
+                self.assertLogs('audit.tasks', 'ERROR') as logs:
+            tasks._send_share_email('Report', 'Body', 'from@example.com', 'to@example.com')
+        self.assertIn('to@example.com', logs.output[0])
+
+    def test_client_dashboard_lists_project_counts(self):
+        ClientModel.objects.create(name='Beta')
+        self.client.force_login(self.user)
+        resp = self.client.get(reverse('audit:client-dashboard'))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            [(c['name'], c['project_count']) for c in resp.context['clients']],
+            [('ACME', 1), ('Beta', 0)],
+        )
+
     def test_client_detail_and_update(self):
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         resp = self.client.get(reverse('audit:client-detail-ajax', args=[self.client_org.pk]))
         self.assertEqual(resp.status_code, 200)
         data = resp.json()
@@ -145,23 +226,184 @@ class AuditAppTests(TestCase):
         self.assertEqual(self.client_org.contact_name, 'New Contact')
         self.assertEqual(self.client_org.contact_email, 'new@example.com')
 
+        missing = self.client.post(reverse('audit:client-update-ajax', args=[self.client_org.pk + 1000]), data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(missing.status_code, 404)
+
     def test_report_detail_view_requires_login_and_shows_data(self):
         # anonymous -> redirected to login (login_url='/') because of login_url set in view
-        resp = self.client.get(reverse('audit:report-detail', args=[self.audit.pk]))
-        # Should be a redirect to index (since LoginRequiredMixin default behavior is redirect)
-        self.assertIn(resp.status_code, (302, 301))
+        detail_url = reverse('audit:report-detail', args=[self.audit.pk])
+        resp = self.client.get(detail_url)
+        # Should be a redirect to index (since LoginRequiredMixin default behavior is redirect); no need to follow it
+        self.assertRedirects(resp, f'/?next={detail_url}', fetch_redirect_response=False)
 
         # login and try again
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         resp2 = self.client.get(reverse('audit:report-detail', args=[self.audit.pk]))
         self.assertEqual(resp2.status_code, 200)
         self.assertContains(resp2, self.audit.report_number)
 
+    def test_report_detail_json(self):
+        self.client.force_login(self.user)
+        ActionItem.objects.create(audit=self.audit, description='Fix signage', assigned_to='PC')
+        resp = self.client.get(reverse('audit:report-detail-json', args=[self.audit.pk]))
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()['audit']
+        self.assertEqual(data['report_number'], self.audit.report_number)
+        self.assertEqual([item['description'] for item in data['action_items']], ['Fix signage'])
+        self.assertEqual(data['legal_appointments'], [])
+        self.assertIsNone(data['personnel'])
+
+        resp2 = self.client.get(reverse('audit:report-detail-json', args=[self.audit.pk + 1000]))
+        self.assertEqual(resp2.status_code, 404)
+
+    def test_detail_json_sql(self):
+        sql = Audit.objects.detail_json_sql(lambda name: f'"{name}"')
+        self.assertEqual(sql, (
+            'SELECT row_to_json(d) FROM (SELECT a.*, '
+            '(SELECT COALESCE(json_agg(c), \'[]\'::json) FROM "audit_legalappointment" c '
+            'WHERE c.audit_id = a.id) AS "legal_appointments", '
+            '(SELECT COALESCE(json_agg(c), \'[]\'::json) FROM "audit_checklistitem" c '
+            'WHERE c.audit_id = a.id) AS "checklist_items", '
+            '(SELECT COALESCE(json_agg(c), \'[]\'::json) FROM "audit_actionitem" c '
+            'WHERE c.audit_id = a.id) AS "action_items", '
+            '(SELECT COALESCE(json_agg(c), \'[]\'::json) FROM "audit_visualobservation" c '
+            'WHERE c.audit_id = a.id) AS "visual_observations", '
+            '(SELECT row_to_json(p) FROM "audit_sitepersonnel" p WHERE p.audit_id = a.id) AS personnel '
+            'FROM "audit_audit" a WHERE a.id = %s) d'
+        ))
+
     def test_report_dashboard_requires_login(self):
         resp = self.client.get(reverse('audit:report-dashboard'))
-        self.assertIn(resp.status_code, (302, 301))
-        self.client.login(username=self.username, password=self.password)
+        self.assertRedirects(resp, f"/?next={reverse('audit:report-dashboard')}", fetch_redirect_response=False)
+        self.client.force_login(self.user)
         resp2 = self.client.get(reverse('audit:report-dashboard'))
         self.assertEqual(resp2.status_code, 200)
         # should contain report_number for at least one audit
         self.assertContains(resp2, self.audit.report_number)
+        self.assertEqual(resp2.context['paginator'].count, 1)
+
+        # the cached total is reused until an audit is added
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(Audit.objects.newest_first(), 10, cache_key=AUDIT_COUNT_CACHE_KEY).count, 1)
+        Audit.objects.create(
+            project=self.project, audit_date='2026-01-03', audit_number='003', performed_by='P',
+            report_number='R-003', overall_score_percentage=50,
+        )
+        resp3 = self.client.get(reverse('audit:report-dashboard'))
+        self.assertEqual(resp3.context['paginator'].count, 2)
+
+    def test_score_totals_follow_checklist_changes(self):
+        item = ChecklistItem.objects.create(
+            audit=self.audit, category=ChecklistCategory.FIRE, item_code=FireItem.AWARENESS, actual_score=2
+        )
+        self.audit.refresh_from_db()
+        self.assertEqual((self.audit.computed_score_sum, self.audit.computed_score_max), (2, 2))
+
+        item.actual_score = 1
+        item.save()
+        self.audit.refresh_from_db()
+        self.assertEqual((self.audit.computed_score_sum, self.audit.computed_score_max), (1, 2))
+
+        item.delete()
+        self.audit.refresh_from_db()
+        self.assertEqual((self.audit.computed_score_sum, self.audit.computed_score_max), (0, 0))
+
+    def test_full_detail_loads_in_five_queries(self):
+        for category, code in ((ChecklistCategory.FIRE, FireItem.AWARENESS), (ChecklistCategory.OHS_DOC, DocumentType.SHE_FILE),
+                               (ChecklistCategory.FIRE, FireItem.EQUIPMENT_AVAILABLE)):
+            ChecklistItem.objects.create(audit=self.audit, category=category, item_code=code, actual_score=2)
+        rating = RiskRating.objects.create(level=RiskRating.RiskLevel.HIGH, time_frame='7 days')
+        ActionItem.objects.create(audit=self.audit, description='Fix signage', assigned_to='PC', risk_rating=rating)
+
+        # audit + project joins + personnel, then one query each for appointments, checklist, observations, actions
+        with self.assertNumQueries(5):
+            audit = Audit.objects.with_full_detail().get(pk=self.audit.pk)
+            sections = audit.checklist_sections()
+            self.assertEqual(audit.project.client.name, 'ACME')
+            self.assertEqual([item.risk_rating.level for item in audit.action_items.all()], ['HIGH'])
+            self.assertEqual(list(audit.legal_appointments.all()), [])
+            self.assertEqual(list(audit.visual_observations.all()), [])
+
+        self.assertEqual(list(sections), [ChecklistCategory.OHS_DOC, ChecklistCategory.FIRE])
+        self.assertEqual(
+            sorted(item.item_code for item in sections[ChecklistCategory.FIRE]),
+            [FireItem.EQUIPMENT_AVAILABLE, FireItem.AWARENESS],
+        )
+
+    def test_audit_save_keeps_score_totals(self):
+        audit = Audit.objects.get(pk=self.audit.pk)
+        ChecklistItem.objects.create(
+            audit=audit, category=ChecklistCategory.FIRE, item_code=FireItem.AWARENESS, actual_score=2
+        )
+        # audit still holds the 0/0 totals it was loaded with
+        audit.performed_by = 'Editor'
+        audit.save()
+        audit.refresh_from_db()
+        self.assertEqual(audit.performed_by, 'Editor')
+        self.assertEqual((audit.computed_score_sum, audit.computed_score_max), (2, 2))
+
+    def test_audit_save_keeps_open_action_items(self):
+        audit = Audit.objects.get(pk=self.audit.pk)
+        ActionItem.objects.create(audit=audit, description='Fix signage', assigned_to='PC')
+        audit.performed_by = 'Editor'
+        audit.save()
+        audit.refresh_from_db()
+        self.assertEqual(audit.open_action_items, 1)
+
+    def test_open_action_items_counter(self):
+        item = ActionItem.objects.create(audit=self.audit, description='Fix signage', assigned_to='PC')
+        self.assertEqual(str(ActionItem.objects.only('description_preview').get(pk=item.pk)), 'Action Item: Fix signage')
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 1)
+
+        loaded = ActionItem.objects.get(pk=item.pk)
+        loaded.completed = True
+        loaded.save()
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 0)
+
+        loaded.completed = False
+        loaded.save()
+        loaded.delete()
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 0)
+
+        # bulk changes skip the signals; deletes stay valid and a recount repairs the counter
+        drifted = ActionItem.objects.create(audit=self.audit, description='Barricade', assigned_to='PC', completed=True)
+        ActionItem.objects.filter(pk=drifted.pk).update(completed=False)
+        ActionItem.objects.get(pk=drifted.pk).delete()
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 0)
+        ActionItem.objects.create(audit=self.audit, description='Signage', assigned_to='PC', completed=True)
+        ActionItem.objects.filter(audit=self.audit).update(completed=False)
+        Audit.objects.refresh_open_action_items()
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 1)
+
+    def test_recompute_audit_scores(self):
+        ChecklistItem.objects.create(
+            audit=self.audit, category=ChecklistCategory.FIRE, item_code=FireItem.AWARENESS, actual_score=1
+        )
+        out = StringIO()
+        call_command('recompute_audit_scores', stdout=out)
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.overall_score_bp, 8000)
+        self.assertIn(f'{self.audit.report_number} (#{self.audit.pk}): 80.00% -> 50.00%', out.getvalue())
+
+        call_command('recompute_audit_scores', '--apply', '--audit', str(self.audit.pk + 1000), stdout=StringIO())
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.overall_score_bp, 8000)
+
+        call_command('recompute_audit_scores', '--apply', '--report-number', self.audit.report_number, stdout=StringIO())
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.overall_score_bp, 5000)
+
+    def test_recompute_audit_scores_recounts_open_items_only_when_asked(self):
+        ActionItem.objects.bulk_create([ActionItem(audit=self.audit, description='Fix signage', assigned_to='PC')])
+        call_command('recompute_audit_scores', '--apply', stdout=StringIO())
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 0)
+
+        call_command('recompute_audit_scores', '--apply', '--recount-open-items', stdout=StringIO())
+        self.audit.refresh_from_db()
+        self.assertEqual(self.audit.open_action_items, 1)
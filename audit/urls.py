@@ -5,7 +5,7 @@ from django.urls import path
 from audit.views import (
     IndexView, Dashboard, LoginAjaxView, ClientDashboard, ReportDashboard,
     LogoutAjaxView, ClientDetailAjaxView, ClientUpdateAjaxView,
-    AuditDetailView, AuditCreateView, AuditShareAjaxView,
+    AuditDetailView, AuditDetailJsonView, AuditCreateView, AuditBulkCreateView, AuditShareAjaxView,
 
 )
 
@@ -22,7 +22,9 @@ urlpatterns = [
     # path('clients/<int:pk>/view/', ClientDetailView.as_view(), name='client-detail-view'),
     path('reports/', ReportDashboard.as_view(), name='report-dashboard'),
     path('reports/create/', AuditCreateView.as_view(), name='report-create-ajax'),
+    path('reports/bulk-create/', AuditBulkCreateView.as_view(), name='report-bulk-create-ajax'),
     path('reports/<int:pk>/', AuditDetailView.as_view(), name='report-detail'),
+    path('reports/<int:pk>/json/', AuditDetailJsonView.as_view(), name='report-detail-json'),
     path('reports/<int:pk>/share/', AuditShareAjaxView.as_view(), name='report-share-ajax'),
 ]
 
@@ -1,16 +1,65 @@
 from django.contrib.auth import authenticate, login, logout
-from django.http import JsonResponse
+from decimal import Decimal
+from functools import lru_cache
+
+import orjson
+from django.http import Http404, HttpResponse
 from django.views.generic import TemplateView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
 from django.http import HttpResponseRedirect
-import json
-from django.core.mail import send_mail
+from django.core.cache import cache
 from django.conf import settings
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.core.serializers.json import DjangoJSONEncoder
-from audit.forms import ClientForm, AuditForm, AuditScoreForm, AuditNoticesForm, AuditModelForm
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.core.validators import validate_email
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.functional import Promise
+from audit.models import Audit, Client
+from audit.tasks import send_share_email
+from audit.pagination import CachedCountPaginator, AUDIT_COUNT_CACHE_KEY
+from audit.forms import (
+    ClientForm, AuditForm, AuditScoreForm, AuditNoticesForm, AuditModelForm, AuditFormSet,
+    AUDIT_CREATE_METADATA_CACHE_KEY,
+)
+
+
+@lru_cache(maxsize=None)
+def _dashboard_url():
+    # reverse_lazy would re-resolve on every str(); the URLconf doesn't change at runtime
+    return reverse('audit:dashboard')
+
+
+def _is_json(request):
+    """True for JSON request bodies; content_type is already parsed (parameters stripped) by the request."""
+    return request.content_type == 'application/json'
+
+
+def _wants_json(request):
+    """True for JSON or XMLHttpRequest callers, which get JSON responses instead of redirects."""
+    return _is_json(request) or request.headers.get('x-requested-with') == 'XMLHttpRequest'
+
+
+def _json_default(obj):
+    # Types orjson doesn't serialize natively; matches DjangoJSONEncoder's output for them
+    if isinstance(obj, (Decimal, Promise)):
+        return str(obj)
+    raise TypeError
+
+
+def _loads(body):
+    """Parse a raw request body; orjson reads the bytes directly, so no decode step."""
+    return orjson.loads(body or b'{}')
+
+
+class OrjsonResponse(HttpResponse):
+    """JsonResponse equivalent serialized with orjson."""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(orjson.dumps(data, default=_json_default), **kwargs)
 
 
 # Create your views here.
@@ -29,9 +78,10 @@ class ClientDashboard(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        from audit.models import Client
-        # Query all clients ordered by name
-        ctx['clients'] = Client.objects.all().order_by('name')
+        # Plain dicts with just the rendered columns; project counts come from one grouped JOIN instead of a COUNT per row
+        ctx['clients'] = list(
+            Client.objects.order_by('name').values('id', 'name').annotate(project_count=Count('project'))
+        )
         return ctx
 
 
@@ -41,11 +91,10 @@ class ReportDashboard(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        from audit.models import Audit
-        # Fetch audits with related project and client to avoid N+1 queries
-        audit_qs = Audit.objects.select_related('project', 'project__client').order_by('-audit_date')
-        # Paginate
-        paginator = Paginator(audit_qs, 10)  # 10 audits per page
+        # Fetch only the listed columns, with related project and client joined to avoid N+1 queries
+        audit_qs = Audit.objects.for_list().newest_first()
+        # Paginate; the total comes from the cache instead of a COUNT(*) per page view
+        paginator = CachedCountPaginator(audit_qs, 10, cache_key=AUDIT_COUNT_CACHE_KEY)  # 10 audits per page
         page = self.request.GET.get('page')
         try:
             audits_page = paginator.page(page)
@@ -71,16 +120,16 @@ class LoginAjaxView(View):
         # Parse data from JSON body or form-encoded POST
         username = ''
         password = ''
-        is_json = request.content_type == 'application/json'
+        is_json = _is_json(request)
         if is_json:
             try:
-                payload = json.loads(request.body.decode('utf-8') or '{}')
+                payload = _loads(request.body)
             except Exception:
                 # For non-AJAX we'll redirect with message; for AJAX return JSON
                 if not is_json:
                     messages.error(request, 'Invalid request payload.')
                     return redirect('audit:index')
-                return JsonResponse({'success': False, 'errors': {'__all__': 'Invalid request payload.'}}, status=400)
+                return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid request payload.'}}, status=400)
             username = (payload.get('username') or '').strip()
             password = payload.get('password') or ''
         else:
@@ -98,7 +147,7 @@ class LoginAjaxView(View):
                 for v in errors.values():
                     messages.error(request, v)
                 return redirect('audit:index')
-            return JsonResponse({'success': False, 'errors': errors}, status=400)
+            return OrjsonResponse({'success': False, 'errors': errors}, status=400)
 
         user = authenticate(request, username=username, password=password)
         if user is None:
@@ -106,32 +155,27 @@ class LoginAjaxView(View):
             if not is_json:
                 messages.error(request, 'Invalid username or password.')
                 return redirect('audit:index')
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Invalid username or password.'}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid username or password.'}}, status=400)
         if not user.is_active:
             if not is_json:
                 messages.error(request, 'This account is inactive.')
                 return redirect('audit:index')
-            return JsonResponse({'success': False, 'errors': {'__all__': 'This account is inactive.'}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'This account is inactive.'}}, status=400)
 
         # Log the user in (Django handles password hashing and session security)
         login(request, user)
 
-        # Determine a safe redirect. Prefer reversing the named URL if available.
-        try:
-            from django.urls import reverse
-
-            redirect_url = reverse('audit:dashboard')
-        except Exception:
-            redirect_url = '/dash/'
+        # Determine a safe redirect; the reversed dashboard URL is computed once per process
+        redirect_url = _dashboard_url()
 
         # If the request was AJAX/JSON prefer JSON response, otherwise redirect
-        if is_json or request.headers.get('x-requested-with') == 'XMLHttpRequest':
-            return JsonResponse({'success': True, 'redirect': redirect_url})
+        if _wants_json(request):
+            return OrjsonResponse({'success': True, 'redirect': redirect_url})
         return HttpResponseRedirect(redirect_url)
 
     def get(self, request, *args, **kwargs):
         # Disallow GET for login endpoint
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
+        return OrjsonResponse({'detail': 'Method not allowed.'}, status=405)
 
 
 class LogoutAjaxView(View):
@@ -140,65 +184,64 @@ class LogoutAjaxView(View):
     def post(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             # If this is an AJAX/JSON request return JSON error, otherwise redirect to index
-            if request.content_type == 'application/json' or request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'errors': {'__all__': 'Not authenticated.'}}, status=400)
+            if _wants_json(request):
+                return OrjsonResponse({'success': False, 'errors': {'__all__': 'Not authenticated.'}}, status=400)
             messages.error(request, 'Not authenticated.')
             return redirect('audit:index')
         # perform logout
         logout(request)
         # If AJAX/JSON request, return JSON indicating redirect; otherwise perform a redirect to index
-        if request.content_type == 'application/json' or request.headers.get('x-requested-with') == 'XMLHttpRequest':
-            return JsonResponse({'success': True, 'redirect': '/'})
+        if _wants_json(request):
+            return OrjsonResponse({'success': True, 'redirect': '/'})
         return HttpResponseRedirect('/')
 
     def get(self, request, *args, **kwargs):
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
+        return OrjsonResponse({'detail': 'Method not allowed.'}, status=405)
 
 
 class ClientDetailAjaxView(LoginRequiredMixin, View):
     """Return client details as JSON for display in modal."""
 
     def get(self, request, pk, *args, **kwargs):
-        from audit.models import Client
-        client = get_object_or_404(Client, pk=pk)
-        data = {
-            'id': client.id,
-            'name': client.name,
-            'contact_name': client.contact_name or '',
-            'contact_email': client.contact_email or '',
-            'contact_phone': client.contact_phone or '',
-            'address': client.address or '',
-        }
-        return JsonResponse(data, encoder=DjangoJSONEncoder)
+        # Straight from the cursor as a dict; no Client instance needed for five columns
+        data = Client.objects.filter(pk=pk).values(
+            'id', 'name', 'contact_name', 'contact_email', 'contact_phone', 'address'
+        ).first()
+        if data is None:
+            raise Http404('No Client matches the given query.')
+        return OrjsonResponse({k: (v or '') for k, v in data.items()})
 
 
 class ClientUpdateAjaxView(LoginRequiredMixin, View):
-    """Accept POST with updated client fields and save via ClientForm."""
+    """Accept POST with updated client fields, validated by ClientForm and written with a single UPDATE."""
 
     def post(self, request, pk, *args, **kwargs):
-        from audit.models import Client
-        client = get_object_or_404(Client, pk=pk)
         # Support JSON body or form-encoded
-        if request.content_type == 'application/json':
+        if _is_json(request):
             try:
-                payload = json.loads(request.body.decode('utf-8') or '{}')
+                payload = _loads(request.body)
             except Exception:
-                return JsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
+                return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
             # only pass allowed fields
-            allowed = {k: payload.get(k) for k in ['contact_name', 'contact_email', 'contact_phone', 'address']}
-            form = ClientForm(allowed, instance=client)
+            allowed = {k: payload.get(k) for k in ClientForm.Meta.fields}
+            form = ClientForm(allowed)
         else:
-            form = ClientForm(request.POST, instance=client)
+            form = ClientForm(request.POST)
 
+        # ClientForm has no uniqueness checks, so it validates without loading the client first
         if form.is_valid():
-            form.save()
-            return JsonResponse({'success': True})
+            updated = Client.objects.filter(pk=pk).update(
+                **{name: form.cleaned_data[name] for name in ClientForm.Meta.fields}
+            )
+            if not updated:
+                raise Http404('No Client matches the given query.')
+            return OrjsonResponse({'success': True})
         else:
             # Return form errors in a simple dict
             errors = {k: v.get_json_data() for k, v in form.errors.items()}
             # Convert to simple messages
             simple = {k: [err['message'] for err in v] for k, v in errors.items()}
-            return JsonResponse({'success': False, 'errors': simple}, status=400)
+            return OrjsonResponse({'success': False, 'errors': simple}, status=400)
 
 
 class AuditDetailView(LoginRequiredMixin, TemplateView):
@@ -207,98 +250,118 @@ class AuditDetailView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        from audit.models import Audit
-        audit = get_object_or_404(Audit, pk=kwargs.get('pk'))
+        # Project and its client/consultant/contractor come back in the same SELECT
+        audit = get_object_or_404(Audit.objects.with_project(), pk=kwargs.get('pk'))
         ctx['audit'] = audit
         return ctx
 
 
+class AuditDetailJsonView(LoginRequiredMixin, View):
+    """Read-only JSON for an audit and all of its child collections."""
+
+    def get(self, request, *args, **kwargs):
+        data = Audit.objects.detail_json(kwargs.get('pk'))
+        if data is None:
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Audit not found.'}}, status=404)
+        return OrjsonResponse({'success': True, 'audit': data})
+
+
+def _build_create_metadata():
+    """Field metadata for AuditCreateView.get; cached, and cleared by audit.signals when projects change."""
+    form = AuditForm()
+    score_form = AuditScoreForm()
+    notices_form = AuditNoticesForm()
+
+    # Build metadata lists
+    fields_meta = []
+    for f, fld in form.fields.items():
+        meta = {'name': f}
+        # ModelChoiceField: include queryset choices (serialize PKs and labels)
+        if getattr(fld, 'queryset', None) is not None:
+            try:
+                meta['choices'] = [{'value': str(o.pk), 'label': str(o)} for o in fld.queryset.all()]
+            except Exception:
+                # Fallback to using field.choices if queryset iteration fails
+                if getattr(fld, 'choices', None):
+                    meta['choices'] = [{'value': str(c[0]), 'label': str(c[1])} for c in fld.choices]
+        # choices for simple ChoiceField
+        elif getattr(fld, 'choices', None):
+            meta['choices'] = [{'value': str(c[0]), 'label': str(c[1])} for c in fld.choices]
+        # widget type
+        if fld.__class__.__name__.lower().find('date') != -1 or getattr(fld, 'input_type', '') == 'date':
+            meta['type'] = 'date'
+        else:
+            meta['type'] = 'text'
+        fields_meta.append(meta)
+
+    score_meta = [{'name': f, 'type': 'number'} for f in score_form.fields]
+    notice_meta = [{'name': f, 'type': 'number'} for f in notices_form.fields]
+
+    return {
+        'fields': fields_meta,
+        'score_fields': score_meta,
+        'notice_fields': notice_meta,
+    }
+
+
 class AuditCreateView(LoginRequiredMixin, View):
     """Handle segmented creation of a new Audit via AJAX (accepts JSON)."""
 
     def get(self, request, *args, **kwargs):
         # Return structured field metadata so client can render appropriate inputs
-        form = AuditForm()
-        score_form = AuditScoreForm()
-        notices_form = AuditNoticesForm()
-
-        def field_meta(f):
-            meta = {'name': f.name}
-            field = form.fields.get(f.name) if f in form else None
-            # try to detect choices
-            try:
-                fld = form.fields[f.name]
-            except Exception:
-                fld = None
-            if fld is not None and getattr(fld, 'choices', None):
-                meta['choices'] = [{'value': c[0], 'label': c[1]} for c in fld.choices]
-            # type hints
-            if fld is not None:
-                from django.forms import DateField
-                if isinstance(fld, DateField):
-                    meta['type'] = 'date'
-                else:
-                    meta['type'] = 'text'
-            return meta
-
-        # Build metadata lists
-        fields_meta = []
-        for f in AuditForm().fields:
-            fld = AuditForm().fields[f]
-            meta = {'name': f}
-            # ModelChoiceField: include queryset choices (serialize PKs and labels)
-            if getattr(fld, 'queryset', None) is not None:
-                try:
-                    meta['choices'] = [{'value': str(o.pk), 'label': str(o)} for o in fld.queryset.all()]
-                except Exception:
-                    # Fallback to using field.choices if queryset iteration fails
-                    if getattr(fld, 'choices', None):
-                        meta['choices'] = [{'value': str(c[0]), 'label': str(c[1])} for c in fld.choices]
-            # choices for simple ChoiceField
-            elif getattr(fld, 'choices', None):
-                meta['choices'] = [{'value': str(c[0]), 'label': str(c[1])} for c in fld.choices]
-            # widget type
-            if fld.__class__.__name__.lower().find('date') != -1 or getattr(fld, 'input_type', '') == 'date':
-                meta['type'] = 'date'
-            else:
-                meta['type'] = 'text'
-            fields_meta.append(meta)
-
-        score_meta = []
-        for f in AuditScoreForm().fields:
-            fld = AuditScoreForm().fields[f]
-            meta = {'name': f, 'type': 'number'}
-            score_meta.append(meta)
-
-        notice_meta = []
-        for f in AuditNoticesForm().fields:
-            fld = AuditNoticesForm().fields[f]
-            meta = {'name': f, 'type': 'number'}
-            notice_meta.append(meta)
-
-        return JsonResponse({
-            'fields': fields_meta,
-            'score_fields': score_meta,
-            'notice_fields': notice_meta,
-        })
+        return OrjsonResponse(cache.get_or_set(AUDIT_CREATE_METADATA_CACHE_KEY, _build_create_metadata, 300))
 
     def post(self, request, *args, **kwargs):
         # Accept combined JSON payload and validate with AuditModelForm
-        if request.content_type != 'application/json':
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Expected JSON payload.'}}, status=400)
+        if not _is_json(request):
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Expected JSON payload.'}}, status=400)
         try:
-            payload = json.loads(request.body.decode('utf-8') or '{}')
+            payload = _loads(request.body)
         except Exception:
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
 
         form = AuditModelForm(payload)
         if form.is_valid():
             audit = form.save()
-            return JsonResponse({'success': True, 'id': audit.id})
+            return OrjsonResponse({'success': True, 'id': audit.id})
         else:
             errors = {k: v.get_json_data() for k, v in form.errors.items()}
             simple = {k: [err['message'] for err in v] for k, v in errors.items()}
-            return JsonResponse({'success': False, 'errors': simple}, status=400)
+            return OrjsonResponse({'success': False, 'errors': simple}, status=400)
+
+
+class AuditBulkCreateView(LoginRequiredMixin, View):
+    """Create several audits from a JSON array, validated as one formset and inserted with bulk_create."""
+
+    def post(self, request, *args, **kwargs):
+        if not _is_json(request):
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Expected JSON payload.'}}, status=400)
+        try:
+            payload = _loads(request.body or b'[]')
+        except Exception:
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
+        if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Expected a list of audits.'}}, status=400)
+
+        # Flatten the list into formset POST data: form-0-project, form-1-project, ...
+        prefix = AuditFormSet.get_default_prefix()
+        data = {f'{prefix}-TOTAL_FORMS': len(payload), f'{prefix}-INITIAL_FORMS': 0}
+        for i, item in enumerate(payload):
+            data.update({f'{prefix}-{i}-{k}': v for k, v in item.items()})
+
+        formset = AuditFormSet(data, queryset=Audit.objects.none())
+        if not formset.is_valid():
+            errors = [{k: [err['message'] for err in v] for k, v in form.errors.get_json_data().items()}
+                      for form in formset.forms]
+            non_form = [err['message'] for err in formset.non_form_errors().get_json_data()]
+            if non_form:
+                return OrjsonResponse({'success': False, 'errors': {'__all__': non_form}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': errors}, status=400)
+
+        audits = Audit.objects.bulk_create([form.instance for form in formset.forms])
+        # bulk_create skips post_save, so clear the cached report count here
+        cache.delete(AUDIT_COUNT_CACHE_KEY)
+        return OrjsonResponse({'success': True, 'ids': [audit.id for audit in audits]})
 
 
 class AuditShareAjaxView(LoginRequiredMixin, View):
@@ -306,30 +369,27 @@ class AuditShareAjaxView(LoginRequiredMixin, View):
     Sends email with a link to the report detail view."""
 
     def post(self, request, pk, *args, **kwargs):
-        from audit.models import Audit
-        from django.core.validators import validate_email
-        from django.core.exceptions import ValidationError
 
-        audit = get_object_or_404(Audit, pk=pk)
-        if request.content_type != 'application/json':
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Expected JSON payload.'}}, status=400)
+        # Only the columns the email needs
+        audit = get_object_or_404(Audit.objects.only('id', 'report_number'), pk=pk)
+        if not _is_json(request):
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Expected JSON payload.'}}, status=400)
         try:
-            payload = json.loads(request.body.decode('utf-8') or '{}')
+            payload = _loads(request.body)
         except Exception:
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Invalid JSON payload.'}}, status=400)
         to_email = (payload.get('to_email') or '').strip()
         message = payload.get('message', '')
         if not to_email:
-            return JsonResponse({'success': False, 'errors': {'to_email': ['Recipient email required.']}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'to_email': ['Recipient email required.']}}, status=400)
         # Validate email format
         try:
             validate_email(to_email)
         except ValidationError:
-            return JsonResponse({'success': False, 'errors': {'to_email': ['Enter a valid email address.']}}, status=400)
+            return OrjsonResponse({'success': False, 'errors': {'to_email': ['Enter a valid email address.']}}, status=400)
 
         # Build absolute URL to the report detail
         try:
-            from django.urls import reverse
             url = request.build_absolute_uri(reverse('audit:report-detail', args=[audit.id]))
         except Exception:
             url = request.build_absolute_uri(f"/reports/{audit.id}/")
@@ -340,10 +400,10 @@ class AuditShareAjaxView(LoginRequiredMixin, View):
         # Determine from email
         from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', None) or getattr(settings, 'SERVER_EMAIL', None) or 'no-reply@localhost'
 
-        # Send email — relies on Django email settings; in production ensure TLS and creds configured
+        # Send email in the background — relies on Django email settings; in production ensure TLS and creds configured
         try:
-            send_mail(subject, body, from_email, [to_email], fail_silently=False)
-            return JsonResponse({'success': True})
+            send_share_email(subject, body, from_email, to_email)
+            return OrjsonResponse({'success': True})
         except Exception as e:
             # Return sanitized error message
-            return JsonResponse({'success': False, 'errors': {'__all__': 'Failed to send email: ' + str(e)}}, status=500)
+            return OrjsonResponse({'success': False, 'errors': {'__all__': 'Failed to send email: ' + str(e)}}, status=500)
@@ -16,9 +16,38 @@ DEBUG = os.getenv("DEBUG", "False") == "True"
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
 
 # Replace DATABASES with:
+# Connections persist for CONN_MAX_AGE seconds so requests skip the TCP/TLS handshake;
+# health checks drop ones the server has closed before they're reused.
 DATABASES = {
-    "default": dj_database_url.parse(os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}"))
+    "default": dj_database_url.parse(
+        os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
+        conn_max_age=int(os.getenv("DB_CONN_MAX_AGE", "600")),
+        conn_health_checks=True,
+    )
 }
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    # Cap queries at 5s so a stuck statement can't pin a persistent connection and its worker
+    DATABASES["default"].setdefault("OPTIONS", {})["options"] = "-c statement_timeout=5000"
+
+# Keep `manage.py test` on in-memory SQLite even when DATABASE_URL points at Postgres
+if TESTING:
+    DATABASES["default"] = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+
+# Shared Redis cache when REDIS_URL is set. Sessions are only served from the cache (cached_db)
+# in that case: with per-worker local-memory caches a logout on one worker would leave the session
+# cached, and still authenticating, on the others. Without Redis, sessions stay on the db backend
+# and caching is disabled, because the signal-based clears of the report count and create-form
+# metadata would otherwise only reach the worker that handled the write.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
 
 # Insert WhiteNoise middleware just after SecurityMiddleware
 MIDDLEWARE = [
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -26,6 +27,9 @@ DEBUG = True
 
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', 'testserver']
 
+# True while running `manage.py test`; lets background work run inline under the test runner
+TESTING = 'test' in sys.argv[1:2]
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -78,6 +82,10 @@ DATABASES = {
     }
 }
 
+if TESTING:
+    # Tests never touch db.sqlite3: an in-memory database skips schema creation on disk
+    DATABASES['default'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 